@@ -31,8 +31,10 @@ from src.advanced_prep.indicators import (
     init_ema_state,
     init_rsi_state,
     update_atr_streaming,
+    update_ema_atr_streaming,
     update_ema_streaming,
     update_rsi_streaming,
+    update_rsi_streaming_inplace,
 )
 from src.advanced_prep.multi_symbol import (
     MultiSymbolConfig,
@@ -55,24 +57,34 @@ from src.advanced_prep.rolling import (
     compute_z_score,
 )
 from src.advanced_prep.state import (
+    IndicatorSnapshot,
     IndicatorStates,
     StreamingState,
     TimeframeState,
     create_streaming_state,
+    get_indicator_snapshot,
     get_indicator_values,
     init_indicator_states,
 )
 from src.advanced_prep.transforms import (
+    PATTERN_NAMES,
     compute_candle_body_size,
     compute_candle_range,
     compute_candle_wick_sizes,
     compute_heiken_ashi,
+    compute_heiken_ashi_batch,
+    compute_log_returns_float,
     compute_log_returns_series,
+    compute_percentage_returns_float,
     compute_percentage_returns_series,
+    compute_pivot_bundle,
+    compute_pivot_bundle_float,
     compute_pivot_point,
     compute_support_resistance,
     compute_typical_price,
     detect_candle_pattern,
+    detect_candle_pattern_mask,
+    detect_patterns_batch,
     is_bearish_candle,
     is_bullish_candle,
     is_doji,
@@ -85,7 +97,10 @@ from src.advanced_prep.transforms import (
     is_three_black_crows,
     is_three_white_soldiers,
     normalize_min_max,
+    normalize_min_max_float,
     normalize_z_score,
+    normalize_z_score_float,
+    pattern_mask_to_names,
 )
 from src.advanced_prep.utils import (
     batch_to_chunks,
@@ -132,16 +147,25 @@ __all__ = [
     "init_rsi_state",
     "update_ema_streaming",
     "update_atr_streaming",
+    "update_ema_atr_streaming",
     "update_rsi_streaming",
+    "update_rsi_streaming_inplace",
     # Transforms
     "compute_heiken_ashi",
+    "compute_heiken_ashi_batch",
     "compute_log_returns_series",
     "compute_percentage_returns_series",
+    "compute_log_returns_float",
+    "compute_percentage_returns_float",
     "normalize_min_max",
     "normalize_z_score",
+    "normalize_min_max_float",
+    "normalize_z_score_float",
     "compute_typical_price",
     "compute_pivot_point",
     "compute_support_resistance",
+    "compute_pivot_bundle",
+    "compute_pivot_bundle_float",
     "is_bullish_candle",
     "is_bearish_candle",
     "compute_candle_body_size",
@@ -158,6 +182,10 @@ __all__ = [
     "is_three_white_soldiers",
     "is_three_black_crows",
     "detect_candle_pattern",
+    "detect_candle_pattern_mask",
+    "pattern_mask_to_names",
+    "detect_patterns_batch",
+    "PATTERN_NAMES",
     # Rolling
     "RollingWindow",
     "compute_rolling_mean",
@@ -167,9 +195,11 @@ __all__ = [
     "StreamingState",
     "TimeframeState",
     "IndicatorStates",
+    "IndicatorSnapshot",
     "create_streaming_state",
     "init_indicator_states",
     "get_indicator_values",
+    "get_indicator_snapshot",
     # Registry
     "IndicatorRegistry",
     "IndicatorMetadata",
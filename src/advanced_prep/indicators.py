@@ -11,6 +11,8 @@ from decimal import Decimal
 
 from src.advanced_prep.rolling import RollingWindow
 
+_ONE = Decimal(1)
+
 
 @dataclass
 class EMAState:
@@ -307,6 +309,47 @@ def update_atr_streaming(state: ATRState, high: Decimal, low: Decimal, close: De
     )
 
 
+def update_ema_atr_streaming(
+    ema_fast: EMAState | None,
+    ema_slow: EMAState | None,
+    atr: ATRState | None,
+    high: Decimal,
+    low: Decimal,
+    close: Decimal,
+) -> None:
+    """
+    Fused in-place update of fast/slow EMA and ATR states for one candle.
+
+    Equivalent to update_ema_streaming/update_atr_streaming but mutates the
+    given states instead of allocating new ones per candle.
+
+    Args:
+        ema_fast: Fast EMA state (skipped if None).
+        ema_slow: Slow EMA state (skipped if None).
+        atr: ATR state (skipped if None).
+        high: Candle high.
+        low: Candle low.
+        close: Candle close.
+
+    Side effects:
+        Mutates the provided states.
+    """
+    for ema in (ema_fast, ema_slow):
+        if ema is None:
+            continue
+        if ema.initialized:
+            alpha = ema.alpha
+            ema.value = alpha * close + (_ONE - alpha) * ema.value
+        else:
+            ema.value = close
+            ema.initialized = True
+
+    if atr is not None:
+        atr.tr_window.append(compute_true_range(high, low, atr.prev_close))
+        atr.value = atr.tr_window.mean()
+        atr.prev_close = close
+
+
 def init_rsi_state(period: int, initial_price: Decimal) -> RSIState:
     """
     Initialize RSI state for streaming.
@@ -404,6 +447,63 @@ def update_rsi_streaming(state: RSIState, new_price: Decimal) -> RSIState:
     )
 
 
+def update_rsi_streaming_inplace(state: RSIState, new_price: Decimal) -> None:
+    """
+    In-place update of an RSI state with a new price (streaming).
+
+    Equivalent to update_rsi_streaming but mutates the given state instead of
+    allocating a new one per candle.
+
+    Args:
+        state: RSI state to update.
+        new_price: New price.
+
+    Side effects:
+        Mutates the provided state.
+    """
+    prev_close = state.prev_close
+    state.prev_close = new_price
+    if prev_close is None:
+        state.value = Decimal("50")
+        state.avg_gain = Decimal(0)
+        state.avg_loss = Decimal(0)
+        return
+
+    # Calculate price change
+    change = new_price - prev_close
+    gain = change if change > 0 else Decimal(0)
+    loss = abs(change) if change < 0 else Decimal(0)
+
+    # Update rolling windows
+    state.gains.append(gain)
+    state.losses.append(loss)
+
+    if not state.gains.is_full():
+        # Not enough data yet
+        state.value = Decimal("50")
+        state.avg_gain = Decimal(0)
+        state.avg_loss = Decimal(0)
+        return
+
+    # Use Wilder's smoothing method
+    if state.avg_gain == 0 and state.avg_loss == 0:
+        # First calculation - simple average
+        avg_gain = state.gains.mean()
+        avg_loss = state.losses.mean()
+    else:
+        # Subsequent calculations - smoothed
+        avg_gain = (state.avg_gain * (state.period - 1) + gain) / state.period
+        avg_loss = (state.avg_loss * (state.period - 1) + loss) / state.period
+
+    if avg_loss == 0:
+        state.value = Decimal("100")
+    else:
+        rs = avg_gain / avg_loss
+        state.value = Decimal("100") - (Decimal("100") / (Decimal("1") + rs))
+    state.avg_gain = avg_gain
+    state.avg_loss = avg_loss
+
+
 # === Volatility Indicators ===
 
 
@@ -9,6 +9,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 from src.advanced_prep.pipelines import MultiTimeframePipeline, PipelineConfig
+from src.advanced_prep.resampling import parse_timeframe_to_ms
 from src.types import (
     CandleEmitFn,
     MultiTimeframeReadyFn,
@@ -251,8 +252,6 @@ def create_multi_symbol_pipeline(
     Returns:
         Configured MultiSymbolPipeline.
     """
-    from src.advanced_prep.resampling import parse_timeframe_to_ms
-
     timeframes_ms = [parse_timeframe_to_ms(tf) for tf in timeframes]
 
     config = MultiSymbolConfig(symbols=symbols, timeframes_ms=timeframes_ms)
@@ -8,13 +8,14 @@ timeframes with deterministic, aligned outputs.
 from dataclasses import dataclass
 from decimal import Decimal
 
-from src.advanced_prep.indicators import (
-    update_atr_streaming,
-    update_ema_streaming,
-    update_rsi_streaming,
+from src.advanced_prep.indicators import update_ema_atr_streaming, update_rsi_streaming_inplace
+from src.advanced_prep.resampling import (
+    CandleResampler,
+    format_timeframe,
+    parse_timeframe_to_ms,
 )
-from src.advanced_prep.resampling import CandleResampler, format_timeframe
 from src.advanced_prep.state import (
+    TimeframeState,
     create_streaming_state,
     get_indicator_values,
     init_indicator_states,
@@ -77,9 +78,30 @@ class MultiTimeframePipeline:
         # Create streaming state
         self._state = create_streaming_state(config.symbol, config.timeframes_ms)
 
+        # Cache formatted timeframe labels
+        self._tf_strs: dict[int, str] = {
+            tf_ms: format_timeframe(tf_ms) for tf_ms in config.timeframes_ms
+        }
+
+        # Precomputed (tf_ms, tf_str, tf_state) walk for snapshot building
+        self._snapshot_plan: list[tuple[int, str, TimeframeState]] = []
+        self._build_snapshot_plan()
+
         # Track which timeframes updated in current tick
         self._updated_timeframes: set[int] = set()
 
+    def _build_snapshot_plan(self) -> None:
+        """
+        Precompute per-timeframe entries walked by _build_snapshot.
+
+        Side effects:
+            Replaces snapshot plan; must be rebuilt whenever timeframe states are recreated.
+        """
+        self._snapshot_plan = [
+            (tf_ms, self._tf_strs[tf_ms], self._state.get_or_create_timeframe_state(tf_ms))
+            for tf_ms in self._config.timeframes_ms
+        ]
+
     def process_tick(self, tick: TickData) -> None:
         """
         Process incoming tick through all timeframes.
@@ -142,8 +164,7 @@ class MultiTimeframePipeline:
 
         # Emit candle callback
         if self._on_candle:
-            tf_str = format_timeframe(tf_ms)
-            self._on_candle(tf_str, candle)
+            self._on_candle(self._tf_strs[tf_ms], candle)
 
     def _update_indicators(self, tf_state, candle: ResampledCandleData) -> None:
         """
@@ -157,29 +178,25 @@ class MultiTimeframePipeline:
             Updates indicator states.
         """
         close = candle["close"]
-        high = candle["high"]
-        low = candle["low"]
-
-        # Update EMAs
-        if tf_state.indicators.ema_fast:
-            tf_state.indicators.ema_fast = update_ema_streaming(tf_state.indicators.ema_fast, close)
-
-        if tf_state.indicators.ema_slow:
-            tf_state.indicators.ema_slow = update_ema_streaming(tf_state.indicators.ema_slow, close)
-
-        # Update ATR
-        if tf_state.indicators.atr:
-            tf_state.indicators.atr = update_atr_streaming(
-                tf_state.indicators.atr, high, low, close
-            )
+        indicators = tf_state.indicators
+
+        # Update EMAs and ATR in a single fused step
+        update_ema_atr_streaming(
+            indicators.ema_fast,
+            indicators.ema_slow,
+            indicators.atr,
+            candle["high"],
+            candle["low"],
+            close,
+        )
 
         # Update RSI
-        if tf_state.indicators.rsi:
-            tf_state.indicators.rsi = update_rsi_streaming(tf_state.indicators.rsi, close)
+        if indicators.rsi:
+            update_rsi_streaming_inplace(indicators.rsi, close)
 
         # Update rolling window
-        if tf_state.indicators.rolling_window:
-            tf_state.indicators.rolling_window.append(close)
+        if indicators.rolling_window:
+            indicators.rolling_window.append(close)
 
     def _build_snapshot(self) -> MultiTimeframeSnapshotData | None:
         """
@@ -191,13 +208,11 @@ class MultiTimeframePipeline:
         candles: dict[str, ResampledCandleData] = {}
         indicators: dict[str, dict[str, Decimal]] = {}
 
-        for tf_ms in self._config.timeframes_ms:
-            tf_str = format_timeframe(tf_ms)
-            last_candle = self._state.get_last_candle(tf_ms)
+        for _tf_ms, tf_str, tf_state in self._snapshot_plan:
+            last_candle = tf_state.last_candle
 
             if last_candle:
                 candles[tf_str] = last_candle
-                tf_state = self._state.get_or_create_timeframe_state(tf_ms)
                 indicators[tf_str] = get_indicator_values(tf_state)
 
         if not candles:
@@ -243,6 +258,7 @@ class MultiTimeframePipeline:
         for resampler in self._resamplers.values():
             resampler.reset()
         self._state.reset()
+        self._build_snapshot_plan()
         self._updated_timeframes.clear()
 
 
@@ -264,8 +280,6 @@ def create_pipeline(
     Returns:
         Configured MultiTimeframePipeline.
     """
-    from src.advanced_prep.resampling import parse_timeframe_to_ms
-
     timeframes_ms = [parse_timeframe_to_ms(tf) for tf in timeframes]
 
     config = PipelineConfig(symbol=symbol, timeframes_ms=timeframes_ms)
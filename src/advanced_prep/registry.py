@@ -5,7 +5,6 @@ Provides registration, lookup, and validation for indicators with their
 parameters and computation functions.
 """
 
-import contextlib
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
@@ -183,6 +182,6 @@ def register_default_indicators() -> None:
     ]
 
     for indicator in indicators:
-        with contextlib.suppress(ValueError):
-            # Already registered, skip
+        # Skip already-registered indicators without raising
+        if not _global_registry.is_registered(indicator.name):
             register_indicator(indicator)
@@ -4,6 +4,7 @@ Rolling window implementation using ring buffers for O(1) operations.
 Provides efficient rolling statistics and window management for streaming data.
 """
 
+import math
 from collections import deque
 from collections.abc import Sequence
 from decimal import Decimal
@@ -27,7 +28,10 @@ class RollingWindow:
         self._size = size
         self._buffer: deque[Decimal] = deque(maxlen=size)
         self._sum = Decimal(0)
-        self._sum_squares = Decimal(0)
+        # Welford running mean and sum of squared deviations (float) for std
+        self._mean_f = 0.0
+        self._m2 = 0.0
+        self._evictions = 0
 
     def append(self, value: Decimal) -> None:
         """
@@ -39,16 +43,47 @@ class RollingWindow:
         Side effects:
             Updates internal buffer and cached sums.
         """
-        # If buffer is full, remove oldest from sums
+        x = float(value)
+
+        # If buffer is full, replace oldest in sums (sliding Welford update)
         if len(self._buffer) == self._size:
             oldest = self._buffer[0]
             self._sum -= oldest
-            self._sum_squares -= oldest * oldest
+
+            old = float(oldest)
+            old_mean = self._mean_f
+            self._mean_f = old_mean + (x - old) / self._size
+            self._m2 += (x - old) * (x - self._mean_f + old - old_mean)
+            self._evictions += 1
+        else:
+            delta = x - self._mean_f
+            self._mean_f += delta / (len(self._buffer) + 1)
+            self._m2 += delta * (x - self._mean_f)
 
         # Add new value
         self._buffer.append(value)
         self._sum += value
-        self._sum_squares += value * value
+
+        # Re-anchor the float state once per window turnover to bound drift
+        if self._evictions == self._size:
+            self._recompute_moments()
+
+    def _recompute_moments(self) -> None:
+        """
+        Recompute the float mean and M2 from the buffer.
+
+        Deviations are taken from the first value, so a constant window
+        re-anchors to exactly M2 = 0.
+
+        Side effects:
+            Resets the float running state and eviction counter.
+        """
+        shift = float(self._buffer[0])
+        deviations = [float(v) - shift for v in self._buffer]
+        dev_mean = math.fsum(deviations) / len(deviations)
+        self._mean_f = shift + dev_mean
+        self._m2 = math.fsum((d - dev_mean) ** 2 for d in deviations)
+        self._evictions = 0
 
     def mean(self) -> Decimal:
         """
@@ -63,7 +98,11 @@ class RollingWindow:
 
     def std(self) -> Decimal:
         """
-        Compute rolling standard deviation.
+        Compute rolling (population) standard deviation.
+
+        O(1): uses Welford's running M2 in float, re-anchored from the buffer
+        every size evictions to bound rounding drift. Avoids the
+        cancellation-prone E[x^2] - E[x]^2 form and Decimal square roots.
 
         Returns:
             Standard deviation of values in window, or 0 if < 2 elements.
@@ -72,11 +111,12 @@ class RollingWindow:
         if n < 2:
             return Decimal(0)
 
-        variance = (self._sum_squares / n) - (self._sum / n) ** 2
-        # Handle floating point precision issues
-        if variance < 0:
-            variance = Decimal(0)
-        return variance.sqrt()
+        # Guard against tiny negative drift from float rounding
+        m2 = self._m2
+        if m2 <= 0:
+            return Decimal(0)
+        # Shortest float repr rather than the full binary expansion
+        return Decimal(repr(math.sqrt(m2 / n)))
 
     def sum(self) -> Decimal:
         """
@@ -150,7 +190,9 @@ class RollingWindow:
         """
         self._buffer.clear()
         self._sum = Decimal(0)
-        self._sum_squares = Decimal(0)
+        self._mean_f = 0.0
+        self._m2 = 0.0
+        self._evictions = 0
 
 
 def compute_rolling_mean(values: Sequence[Decimal], window: int) -> list[Decimal]:
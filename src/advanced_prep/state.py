@@ -5,17 +5,31 @@ Maintains indicator states, rolling windows, and multi-timeframe candle history
 for efficient streaming updates.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from decimal import Decimal
-
-from src.advanced_prep.indicators import ATRState, EMAState, RSIState
+from itertools import islice
+from typing import NamedTuple
+
+from src.advanced_prep.indicators import (
+    ATRState,
+    EMAState,
+    RSIState,
+    init_atr_state,
+    init_ema_state,
+)
 from src.advanced_prep.rolling import RollingWindow
 from src.types import HeikenAshiData, ResampledCandleData
 
 
-@dataclass
-class IndicatorStates:
-    """Container for all indicator states for a single timeframe."""
+class IndicatorStates(NamedTuple):
+    """
+    Container for all indicator states for a single timeframe.
+
+    Immutable: replace the container (e.g. via _replace) to swap a state.
+    The contained states themselves are updated in place. Read fields by
+    name, not by position.
+    """
 
     ema_fast: EMAState | None = None
     ema_slow: EMAState | None = None
@@ -25,7 +39,18 @@ class IndicatorStates:
     rolling_window: RollingWindow | None = None
 
 
-@dataclass
+class IndicatorSnapshot(NamedTuple):
+    """Current indicator values for a timeframe (None until ready)."""
+
+    ema_fast: Decimal | None = None
+    ema_slow: Decimal | None = None
+    atr: Decimal | None = None
+    rsi: Decimal | None = None
+    rolling_mean: Decimal | None = None
+    rolling_std: Decimal | None = None
+
+
+@dataclass(slots=True)
 class TimeframeState:
     """State for a single timeframe including candles and indicators."""
 
@@ -34,11 +59,52 @@ class TimeframeState:
     prev_candle: ResampledCandleData | None = None
     last_ha_candle: HeikenAshiData | None = None
     indicators: IndicatorStates = field(default_factory=IndicatorStates)
-    candle_history: list[ResampledCandleData] = field(default_factory=list)
+    candle_history: deque[ResampledCandleData] = field(default_factory=deque, repr=False)
+    ohlc_columns: tuple[deque[float], deque[float], deque[float], deque[float]] = field(
+        init=False, repr=False
+    )
     max_history: int = 100
 
-
-@dataclass
+    def __post_init__(self) -> None:
+        """Bound candle history by max_history and build matching float OHLC columns."""
+        max_history = self.max_history
+        history = deque(self.candle_history, maxlen=max_history)
+        self.candle_history = history
+        self.ohlc_columns = (
+            deque((float(c["open"]) for c in history), maxlen=max_history),
+            deque((float(c["high"]) for c in history), maxlen=max_history),
+            deque((float(c["low"]) for c in history), maxlen=max_history),
+            deque((float(c["close"]) for c in history), maxlen=max_history),
+        )
+
+    def __getstate__(self) -> tuple:
+        """Return field values as a flat tuple for pickling."""
+        return (
+            self.timeframe_ms,
+            self.last_candle,
+            self.prev_candle,
+            self.last_ha_candle,
+            self.indicators,
+            self.candle_history,
+            self.ohlc_columns,
+            self.max_history,
+        )
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore field values from __getstate__ output."""
+        (
+            self.timeframe_ms,
+            self.last_candle,
+            self.prev_candle,
+            self.last_ha_candle,
+            self.indicators,
+            self.candle_history,
+            self.ohlc_columns,
+            self.max_history,
+        ) = state
+
+
+@dataclass(slots=True)
 class StreamingState:
     """
     Global streaming state for multi-timeframe pipeline.
@@ -55,6 +121,14 @@ class StreamingState:
     timeframe_states: dict[int, TimeframeState] = field(default_factory=dict)
     last_tick_timestamp_ms: int = 0
 
+    def __getstate__(self) -> tuple:
+        """Return field values as a flat tuple for pickling."""
+        return (self.symbol, self.timeframe_states, self.last_tick_timestamp_ms)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore field values from __getstate__ output."""
+        self.symbol, self.timeframe_states, self.last_tick_timestamp_ms = state
+
     def get_or_create_timeframe_state(self, timeframe_ms: int) -> TimeframeState:
         """
         Get or create state for a timeframe.
@@ -68,9 +142,11 @@ class StreamingState:
         Side effects:
             Creates state if it doesn't exist.
         """
-        if timeframe_ms not in self.timeframe_states:
-            self.timeframe_states[timeframe_ms] = TimeframeState(timeframe_ms=timeframe_ms)
-        return self.timeframe_states[timeframe_ms]
+        state = self.timeframe_states.get(timeframe_ms)
+        if state is None:
+            state = TimeframeState(timeframe_ms=timeframe_ms)
+            self.timeframe_states[timeframe_ms] = state
+        return state
 
     def update_candle(self, timeframe_ms: int, candle: ResampledCandleData) -> None:
         """
@@ -89,13 +165,15 @@ class StreamingState:
         if state.last_candle and candle["open_time_ms"] != state.last_candle["open_time_ms"]:
             state.prev_candle = state.last_candle
 
-            # Add to history if finalized
-            if state.last_candle["is_finalized"]:
-                state.candle_history.append(state.last_candle)
-
-                # Keep history within limit
-                if len(state.candle_history) > state.max_history:
-                    state.candle_history = state.candle_history[-state.max_history :]
+            # Add to history if finalized (deque maxlen drops the oldest)
+            last = state.last_candle
+            if last["is_finalized"]:
+                state.candle_history.append(last)
+                opens, highs, lows, closes = state.ohlc_columns
+                opens.append(float(last["open"]))
+                highs.append(float(last["high"]))
+                lows.append(float(last["low"]))
+                closes.append(float(last["close"]))
 
         state.last_candle = candle
 
@@ -130,10 +208,43 @@ class StreamingState:
             return []
 
         history = state.candle_history
-        if count is not None and count > 0:
-            history = history[-count:]
+        if count is not None and 0 < count < len(history):
+            return list(islice(history, len(history) - count, None))
+
+        return list(history)
+
+    def get_ohlc_columns(
+        self, timeframe_ms: int, count: int | None = None
+    ) -> tuple[list[float], list[float], list[float], list[float]]:
+        """
+        Get candle history as column-oriented float OHLC series.
+
+        Suitable for batch consumers such as detect_patterns_batch without
+        converting candle dicts on every call.
+
+        Args:
+            timeframe_ms: Timeframe in milliseconds.
+            count: Number of candles to retrieve (None = all).
+
+        Returns:
+            Tuple of (opens, highs, lows, closes), oldest first.
+        """
+        state = self.timeframe_states.get(timeframe_ms)
+        if not state:
+            return ([], [], [], [])
+
+        opens, highs, lows, closes = state.ohlc_columns
+        size = len(opens)
+        if count is not None and 0 < count < size:
+            start = size - count
+            return (
+                list(islice(opens, start, None)),
+                list(islice(highs, start, None)),
+                list(islice(lows, start, None)),
+                list(islice(closes, start, None)),
+            )
 
-        return history
+        return (list(opens), list(highs), list(lows), list(closes))
 
     def reset(self) -> None:
         """
@@ -186,15 +297,20 @@ def init_indicator_states(
     Side effects:
         Creates indicator states in the TimeframeState.
     """
-    from src.advanced_prep.indicators import init_atr_state, init_ema_state
-
+    indicators = state.indicators
+    ema_fast_state = indicators.ema_fast
+    ema_slow_state = indicators.ema_slow
     if state.last_candle:
         close_price = state.last_candle["close"]
-        state.indicators.ema_fast = init_ema_state(ema_fast, close_price)
-        state.indicators.ema_slow = init_ema_state(ema_slow, close_price)
+        ema_fast_state = init_ema_state(ema_fast, close_price)
+        ema_slow_state = init_ema_state(ema_slow, close_price)
 
-    state.indicators.atr = init_atr_state(atr_period)
-    state.indicators.rolling_window = RollingWindow(rolling_window)
+    state.indicators = indicators._replace(
+        ema_fast=ema_fast_state,
+        ema_slow=ema_slow_state,
+        atr=init_atr_state(atr_period),
+        rolling_window=RollingWindow(rolling_window),
+    )
 
 
 def get_indicator_values(state: TimeframeState) -> dict[str, Decimal]:
@@ -207,22 +323,55 @@ def get_indicator_values(state: TimeframeState) -> dict[str, Decimal]:
     Returns:
         Dictionary of indicator name -> value.
     """
+    ind = state.indicators
     indicators: dict[str, Decimal] = {}
 
-    if state.indicators.ema_fast and state.indicators.ema_fast.initialized:
-        indicators["ema_fast"] = state.indicators.ema_fast.value
+    if (ema_fast := ind.ema_fast) and ema_fast.initialized:
+        indicators["ema_fast"] = ema_fast.value
 
-    if state.indicators.ema_slow and state.indicators.ema_slow.initialized:
-        indicators["ema_slow"] = state.indicators.ema_slow.value
+    if (ema_slow := ind.ema_slow) and ema_slow.initialized:
+        indicators["ema_slow"] = ema_slow.value
 
-    if state.indicators.atr and state.indicators.atr.tr_window.is_full():
-        indicators["atr"] = state.indicators.atr.value
+    if (atr := ind.atr) and atr.tr_window.is_full():
+        indicators["atr"] = atr.value
 
-    if state.indicators.rsi and state.indicators.rsi.gains.is_full():
-        indicators["rsi"] = state.indicators.rsi.value
+    if (rsi := ind.rsi) and rsi.gains.is_full():
+        indicators["rsi"] = rsi.value
 
-    if state.indicators.rolling_window and state.indicators.rolling_window.is_full():
-        indicators["rolling_mean"] = state.indicators.rolling_window.mean()
-        indicators["rolling_std"] = state.indicators.rolling_window.std()
+    if (rolling_window := ind.rolling_window) and rolling_window.is_full():
+        indicators["rolling_mean"] = rolling_window.mean()
+        indicators["rolling_std"] = rolling_window.std()
 
     return indicators
+
+
+def get_indicator_snapshot(state: TimeframeState) -> IndicatorSnapshot:
+    """
+    Extract current indicator values as a fixed-layout tuple.
+
+    Same readiness rules as get_indicator_values, without building a dict;
+    indicators that are not ready yet are None.
+
+    Args:
+        state: TimeframeState with indicators.
+
+    Returns:
+        IndicatorSnapshot of current values.
+    """
+    ind = state.indicators
+    ema_fast = ind.ema_fast
+    ema_slow = ind.ema_slow
+    atr = ind.atr
+    rsi = ind.rsi
+    window = ind.rolling_window
+    if window is not None and not window.is_full():
+        window = None
+
+    return IndicatorSnapshot(
+        ema_fast=ema_fast.value if ema_fast and ema_fast.initialized else None,
+        ema_slow=ema_slow.value if ema_slow and ema_slow.initialized else None,
+        atr=atr.value if atr and atr.tr_window.is_full() else None,
+        rsi=rsi.value if rsi and rsi.gains.is_full() else None,
+        rolling_mean=window.mean() if window is not None else None,
+        rolling_std=window.std() if window is not None else None,
+    )
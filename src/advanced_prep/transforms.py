@@ -4,10 +4,19 @@ Pure transform functions for candle and price data.
 Includes Heiken Ashi, returns, normalization, and other stateless transforms.
 """
 
+import math
+from collections.abc import Sequence
 from decimal import Decimal
+from itertools import pairwise
 
 from src.types import HeikenAshiData, ResampledCandleData
 
+# Candle pattern thresholds
+_DOJI_THRESHOLD = Decimal("0.1")
+_STAR_DOJI_THRESHOLD = Decimal("0.3")
+_HAMMER_BODY_RATIO = Decimal("0.3")
+_HAMMER_WICK_RATIO = Decimal("2.0")
+
 
 def compute_heiken_ashi(
     current_candle: ResampledCandleData, prev_ha: HeikenAshiData | None
@@ -37,10 +46,14 @@ def compute_heiken_ashi(
         ha_open = (prev_ha["ha_open"] + prev_ha["ha_close"]) / 2
 
     # HA High = max(H, HA_open, HA_close)
-    ha_high = max(high, ha_open, ha_close)
+    ha_high = high if high >= ha_open else ha_open
+    if ha_close > ha_high:
+        ha_high = ha_close
 
     # HA Low = min(L, HA_open, HA_close)
-    ha_low = min(low, ha_open, ha_close)
+    ha_low = low if low <= ha_open else ha_open
+    if ha_close < ha_low:
+        ha_low = ha_close
 
     return {
         "open_time_ms": current_candle["open_time_ms"],
@@ -52,27 +65,86 @@ def compute_heiken_ashi(
     }
 
 
+def compute_heiken_ashi_batch(
+    opens: Sequence[float],
+    highs: Sequence[float],
+    lows: Sequence[float],
+    closes: Sequence[float],
+) -> tuple[list[float], list[float], list[float], list[float]]:
+    """
+    Compute Heiken Ashi series from column-oriented float OHLC (batch).
+
+    Single pass carrying the HA open/close recurrence in locals, avoiding
+    per-candle TypedDict construction.
+
+    Args:
+        opens: Open prices.
+        highs: High prices.
+        lows: Low prices.
+        closes: Close prices.
+
+    Returns:
+        Tuple of (ha_open, ha_high, ha_low, ha_close) lists.
+
+    Raises:
+        ValueError: If series lengths differ.
+    """
+    n = len(opens)
+    if len(highs) != n or len(lows) != n or len(closes) != n:
+        raise ValueError("Price series must have same length")
+
+    ha_opens = [0.0] * n
+    ha_highs = [0.0] * n
+    ha_lows = [0.0] * n
+    ha_closes = [0.0] * n
+
+    prev_open = prev_close = 0.0
+    for i in range(n):
+        open_price = opens[i]
+        high = highs[i]
+        low = lows[i]
+        close = closes[i]
+
+        ha_close = (open_price + high + low + close) * 0.25
+        ha_open = (prev_open + prev_close) * 0.5 if i else (open_price + close) * 0.5
+
+        ha_high = high if high > ha_open else ha_open
+        if ha_close > ha_high:
+            ha_high = ha_close
+        ha_low = low if low < ha_open else ha_open
+        if ha_close < ha_low:
+            ha_low = ha_close
+
+        ha_opens[i] = ha_open
+        ha_highs[i] = ha_high
+        ha_lows[i] = ha_low
+        ha_closes[i] = ha_close
+
+        prev_open = ha_open
+        prev_close = ha_close
+
+    return ha_opens, ha_highs, ha_lows, ha_closes
+
+
 def compute_log_returns_series(prices: list[Decimal]) -> list[Decimal]:
     """
     Compute log returns from price series.
 
+    The price ratio is Decimal, the logarithm is float64 (Decimal.ln is far
+    slower and feature-level precision does not need it); results go back to
+    Decimal through repr so they carry the float's shortest round-trip digits.
+
     Args:
         prices: Price series.
 
     Returns:
         Log returns (length = len(prices) - 1).
     """
-    if len(prices) < 2:
-        return []
-
-    returns: list[Decimal] = []
-    for i in range(1, len(prices)):
-        if prices[i - 1] == 0 or prices[i] == 0:
-            returns.append(Decimal(0))
-        else:
-            returns.append((prices[i] / prices[i - 1]).ln())
-
-    return returns
+    log = math.log
+    return [
+        Decimal(repr(log(curr / prev))) if prev and curr else Decimal(0)
+        for prev, curr in pairwise(prices)
+    ]
 
 
 def compute_percentage_returns_series(prices: list[Decimal]) -> list[Decimal]:
@@ -98,6 +170,33 @@ def compute_percentage_returns_series(prices: list[Decimal]) -> list[Decimal]:
     return returns
 
 
+def compute_log_returns_float(prices: Sequence[float]) -> list[float]:
+    """
+    Compute log returns from float price series (batch fast path).
+
+    Args:
+        prices: Price series as floats.
+
+    Returns:
+        Log returns (length = len(prices) - 1), 0.0 where either price is 0.
+    """
+    log = math.log
+    return [log(curr / prev) if prev and curr else 0.0 for prev, curr in pairwise(prices)]
+
+
+def compute_percentage_returns_float(prices: Sequence[float]) -> list[float]:
+    """
+    Compute percentage returns from float price series (batch fast path).
+
+    Args:
+        prices: Price series as floats.
+
+    Returns:
+        Percentage returns (length = len(prices) - 1), 0.0 where previous price is 0.
+    """
+    return [(curr - prev) / prev * 100.0 if prev else 0.0 for prev, curr in pairwise(prices)]
+
+
 def normalize_min_max(value: Decimal, min_val: Decimal, max_val: Decimal) -> Decimal:
     """
     Normalize value to [0, 1] range using min-max scaling.
@@ -132,6 +231,41 @@ def normalize_z_score(value: Decimal, mean: Decimal, std: Decimal) -> Decimal:
     return (value - mean) / std
 
 
+def normalize_min_max_float(values: Sequence[float], min_val: float, max_val: float) -> list[float]:
+    """
+    Min-max scale a float series to [0, 1] (batch fast path).
+
+    Args:
+        values: Values to normalize.
+        min_val: Minimum value in range.
+        max_val: Maximum value in range.
+
+    Returns:
+        Normalized values, all 0.0 if range is 0.
+    """
+    range_val = max_val - min_val
+    if range_val == 0:
+        return [0.0] * len(values)
+    return [(v - min_val) / range_val for v in values]
+
+
+def normalize_z_score_float(values: Sequence[float], mean: float, std: float) -> list[float]:
+    """
+    Z-score standardize a float series (batch fast path).
+
+    Args:
+        values: Values to normalize.
+        mean: Mean of distribution.
+        std: Standard deviation.
+
+    Returns:
+        Z-scores, all 0.0 if std is 0.
+    """
+    if std == 0:
+        return [0.0] * len(values)
+    return [(v - mean) / std for v in values]
+
+
 def compute_typical_price(high: Decimal, low: Decimal, close: Decimal) -> Decimal:
     """
     Compute typical price (HLC/3).
@@ -183,6 +317,69 @@ def compute_support_resistance(
     return (r1, r2, s1, s2)
 
 
+def compute_pivot_bundle(
+    high: Decimal, low: Decimal, close: Decimal
+) -> tuple[Decimal, Decimal, Decimal, Decimal, Decimal]:
+    """
+    Compute pivot point and support/resistance levels in one pass.
+
+    Equivalent to compute_pivot_point followed by compute_support_resistance,
+    sharing the intermediate sums.
+
+    Args:
+        high: Previous day high.
+        low: Previous day low.
+        close: Previous day close.
+
+    Returns:
+        Tuple of (pivot, R1, R2, S1, S2).
+    """
+    pivot = (high + low + close) / 3
+    double_pivot = pivot + pivot
+    hl_range = high - low
+    return (pivot, double_pivot - low, pivot + hl_range, double_pivot - high, pivot - hl_range)
+
+
+def compute_pivot_bundle_float(
+    highs: Sequence[float], lows: Sequence[float], closes: Sequence[float]
+) -> tuple[list[float], list[float], list[float], list[float], list[float]]:
+    """
+    Compute pivot and support/resistance series from float HLC (batch fast path).
+
+    Args:
+        highs: High prices.
+        lows: Low prices.
+        closes: Close prices.
+
+    Returns:
+        Tuple of (pivot, R1, R2, S1, S2) lists.
+
+    Raises:
+        ValueError: If series lengths differ.
+    """
+    n = len(highs)
+    if len(lows) != n or len(closes) != n:
+        raise ValueError("Price series must have same length")
+
+    pivots = [0.0] * n
+    r1s = [0.0] * n
+    r2s = [0.0] * n
+    s1s = [0.0] * n
+    s2s = [0.0] * n
+    for i in range(n):
+        high = highs[i]
+        low = lows[i]
+        pivot = (high + low + closes[i]) / 3.0
+        hl_range = high - low
+        pivots[i] = pivot
+        r1s[i] = 2.0 * pivot - low
+        r2s[i] = pivot + hl_range
+        s1s[i] = 2.0 * pivot - high
+        s2s[i] = pivot - hl_range
+
+    return pivots, r1s, r2s, s1s, s2s
+
+
 def is_bullish_candle(candle: ResampledCandleData) -> bool:
     """
     Check if candle is bullish (close > open).
@@ -256,8 +453,33 @@ def compute_candle_range(candle: ResampledCandleData) -> Decimal:
 
 # === Advanced Candle Patterns ===
 
-
-def is_doji(candle: ResampledCandleData, threshold: Decimal = Decimal("0.1")) -> bool:
+PATTERN_DOJI = 1 << 0
+PATTERN_HAMMER = 1 << 1
+PATTERN_INVERTED_HAMMER = 1 << 2
+PATTERN_SHOOTING_STAR = 1 << 3
+PATTERN_BULLISH_ENGULFING = 1 << 4
+PATTERN_BEARISH_ENGULFING = 1 << 5
+PATTERN_MORNING_STAR = 1 << 6
+PATTERN_EVENING_STAR = 1 << 7
+PATTERN_THREE_WHITE_SOLDIERS = 1 << 8
+PATTERN_THREE_BLACK_CROWS = 1 << 9
+
+# Pattern names indexed by bit position, in detect_candle_pattern order
+PATTERN_NAMES: tuple[str, ...] = (
+    "doji",
+    "hammer",
+    "inverted_hammer",
+    "shooting_star",
+    "bullish_engulfing",
+    "bearish_engulfing",
+    "morning_star",
+    "evening_star",
+    "three_white_soldiers",
+    "three_black_crows",
+)
+
+
+def is_doji(candle: ResampledCandleData, threshold: Decimal = _DOJI_THRESHOLD) -> bool:
     """
     Detect Doji pattern (open ≈ close).
 
@@ -268,9 +490,11 @@ def is_doji(candle: ResampledCandleData, threshold: Decimal = Decimal("0.1")) ->
     Returns:
         True if Doji pattern detected.
     """
-    body_size = compute_candle_body_size(candle)
-    range_size = compute_candle_range(candle)
+    return _is_doji_pre(compute_candle_body_size(candle), compute_candle_range(candle), threshold)
 
+
+def _is_doji_pre(body_size: Decimal, range_size: Decimal, threshold: Decimal) -> bool:
+    """Doji check on precomputed body and range sizes."""
     if range_size == 0:
         return True
 
@@ -280,8 +504,8 @@ def is_doji(candle: ResampledCandleData, threshold: Decimal = Decimal("0.1")) ->
 def is_hammer(
     candle: ResampledCandleData,
     trend: str = "down",
-    body_ratio_threshold: Decimal = Decimal("0.3"),
-    lower_wick_ratio: Decimal = Decimal("2.0"),
+    body_ratio_threshold: Decimal = _HAMMER_BODY_RATIO,
+    lower_wick_ratio: Decimal = _HAMMER_WICK_RATIO,
 ) -> bool:
     """
     Detect Hammer pattern (bullish reversal).
@@ -295,10 +519,34 @@ def is_hammer(
     Returns:
         True if Hammer pattern detected.
     """
-    body_size = compute_candle_body_size(candle)
-    range_size = compute_candle_range(candle)
     upper_wick, lower_wick = compute_candle_wick_sizes(candle)
+    if trend != "down":
+        # Inverted hammer: long upper wick, small lower wick
+        upper_wick, lower_wick = lower_wick, upper_wick
+    return _is_long_wick_pre(
+        compute_candle_body_size(candle),
+        compute_candle_range(candle),
+        lower_wick,
+        upper_wick,
+        body_ratio_threshold,
+        lower_wick_ratio,
+    )
+
+
+def _is_long_wick_pre(
+    body_size: Decimal,
+    range_size: Decimal,
+    long_wick: Decimal,
+    short_wick: Decimal,
+    body_ratio_threshold: Decimal,
+    wick_ratio: Decimal,
+) -> bool:
+    """
+    Small-body, single-long-wick check on precomputed candle sizes.
 
+    Shared by hammer (long lower wick), inverted hammer and shooting star
+    (long upper wick).
+    """
     if range_size == 0 or body_size == 0:
         return False
 
@@ -306,17 +554,13 @@ def is_hammer(
     if (body_size / range_size) > body_ratio_threshold:
         return False
 
-    # Long lower wick
-    if trend == "down":
-        return (lower_wick / body_size) >= lower_wick_ratio and upper_wick < body_size
-    # inverted hammer
-    return (upper_wick / body_size) >= lower_wick_ratio and lower_wick < body_size
+    return (long_wick / body_size) >= wick_ratio and short_wick < body_size
 
 
 def is_shooting_star(
     candle: ResampledCandleData,
-    body_ratio_threshold: Decimal = Decimal("0.3"),
-    upper_wick_ratio: Decimal = Decimal("2.0"),
+    body_ratio_threshold: Decimal = _HAMMER_BODY_RATIO,
+    upper_wick_ratio: Decimal = _HAMMER_WICK_RATIO,
 ) -> bool:
     """
     Detect Shooting Star pattern (bearish reversal).
@@ -329,19 +573,16 @@ def is_shooting_star(
     Returns:
         True if Shooting Star detected.
     """
-    body_size = compute_candle_body_size(candle)
-    range_size = compute_candle_range(candle)
     upper_wick, lower_wick = compute_candle_wick_sizes(candle)
-
-    if range_size == 0 or body_size == 0:
-        return False
-
-    # Small body at bottom
-    if (body_size / range_size) > body_ratio_threshold:
-        return False
-
-    # Long upper wick, small lower wick
-    return (upper_wick / body_size) >= upper_wick_ratio and lower_wick < body_size
+    # Small body at bottom, long upper wick, small lower wick
+    return _is_long_wick_pre(
+        compute_candle_body_size(candle),
+        compute_candle_range(candle),
+        upper_wick,
+        lower_wick,
+        body_ratio_threshold,
+        upper_wick_ratio,
+    )
 
 
 def is_engulfing_bullish(candle: ResampledCandleData, prev_candle: ResampledCandleData) -> bool:
@@ -355,17 +596,7 @@ def is_engulfing_bullish(candle: ResampledCandleData, prev_candle: ResampledCand
     Returns:
         True if Bullish Engulfing detected.
     """
-    # Current must be bullish, previous must be bearish
-    if not is_bullish_candle(candle) or not is_bearish_candle(prev_candle):
-        return False
-
-    # Current body must engulf previous body
-    curr_body_top = candle["close"]
-    curr_body_bottom = candle["open"]
-    prev_body_top = prev_candle["open"]
-    prev_body_bottom = prev_candle["close"]
-
-    return curr_body_bottom <= prev_body_bottom and curr_body_top >= prev_body_top
+    return _engulfing_kind(candle, prev_candle) == PATTERN_BULLISH_ENGULFING
 
 
 def is_engulfing_bearish(candle: ResampledCandleData, prev_candle: ResampledCandleData) -> bool:
@@ -379,17 +610,28 @@ def is_engulfing_bearish(candle: ResampledCandleData, prev_candle: ResampledCand
     Returns:
         True if Bearish Engulfing detected.
     """
-    # Current must be bearish, previous must be bullish
-    if not is_bearish_candle(candle) or not is_bullish_candle(prev_candle):
-        return False
+    return _engulfing_kind(candle, prev_candle) == PATTERN_BEARISH_ENGULFING
+
 
-    # Current body must engulf previous body
-    curr_body_top = candle["open"]
-    curr_body_bottom = candle["close"]
-    prev_body_top = prev_candle["close"]
-    prev_body_bottom = prev_candle["open"]
+def _engulfing_kind(candle: ResampledCandleData, prev_candle: ResampledCandleData) -> int:
+    """
+    Classify a two-candle engulfing pattern with a single unpacking of both bodies.
 
-    return curr_body_bottom <= prev_body_bottom and curr_body_top >= prev_body_top
+    Returns:
+        PATTERN_BULLISH_ENGULFING, PATTERN_BEARISH_ENGULFING, or 0.
+    """
+    open_p = candle["open"]
+    close = candle["close"]
+    prev_open = prev_candle["open"]
+    prev_close = prev_candle["close"]
+
+    # Bullish after bearish, current body engulfs previous body
+    if close > open_p and prev_close < prev_open and open_p <= prev_close and close >= prev_open:
+        return PATTERN_BULLISH_ENGULFING
+    # Bearish after bullish, current body engulfs previous body
+    if close < open_p and prev_close > prev_open and close <= prev_open and open_p >= prev_close:
+        return PATTERN_BEARISH_ENGULFING
+    return 0
 
 
 def is_morning_star(
@@ -413,7 +655,7 @@ def is_morning_star(
         return False
 
     # Second must be small (doji or small body)
-    if not is_doji(candle2, threshold=Decimal("0.3")):
+    if not is_doji(candle2, threshold=_STAR_DOJI_THRESHOLD):
         return False
 
     # Third must be bullish
@@ -446,7 +688,7 @@ def is_evening_star(
         return False
 
     # Second must be small (doji or small body)
-    if not is_doji(candle2, threshold=Decimal("0.3")):
+    if not is_doji(candle2, threshold=_STAR_DOJI_THRESHOLD):
         return False
 
     # Third must be bearish
@@ -524,47 +766,51 @@ def is_three_black_crows(
     return candle1["close"] > candle2["close"] > candle3["close"]
 
 
-def detect_candle_pattern(
-    candles: list[ResampledCandleData],
-) -> list[str]:
+def detect_candle_pattern_mask(candles: list[ResampledCandleData]) -> int:
     """
-    Detect all applicable candle patterns.
+    Detect all applicable candle patterns as a bitmask.
 
     Args:
         candles: List of candles (1-3 candles depending on pattern).
 
     Returns:
-        List of detected pattern names.
+        Bitmask of PATTERN_* flags (0 if no pattern fired).
     """
-    patterns: list[str] = []
-
     if not candles:
-        return patterns
+        return 0
 
+    mask = 0
     current = candles[-1]
 
-    # Single candle patterns
-    if is_doji(current):
-        patterns.append("doji")
-
-    if is_hammer(current, trend="down"):
-        patterns.append("hammer")
-
-    if is_hammer(current, trend="up"):
-        patterns.append("inverted_hammer")
+    # Single candle patterns share one set of size computations
+    open_p = current["open"]
+    close = current["close"]
+    high = current["high"]
+    low = current["low"]
+    body_high = max(open_p, close)
+    body_low = min(open_p, close)
+    body_size = body_high - body_low
+    range_size = high - low
+    upper_wick = high - body_high
+    lower_wick = body_low - low
+
+    if _is_doji_pre(body_size, range_size, _DOJI_THRESHOLD):
+        mask |= PATTERN_DOJI
+
+    if _is_long_wick_pre(
+        body_size, range_size, lower_wick, upper_wick, _HAMMER_BODY_RATIO, _HAMMER_WICK_RATIO
+    ):
+        mask |= PATTERN_HAMMER
 
-    if is_shooting_star(current):
-        patterns.append("shooting_star")
+    # Inverted hammer and shooting star use identical criteria
+    if _is_long_wick_pre(
+        body_size, range_size, upper_wick, lower_wick, _HAMMER_BODY_RATIO, _HAMMER_WICK_RATIO
+    ):
+        mask |= PATTERN_INVERTED_HAMMER | PATTERN_SHOOTING_STAR
 
     # Two candle patterns
     if len(candles) >= 2:
-        prev = candles[-2]
-
-        if is_engulfing_bullish(current, prev):
-            patterns.append("bullish_engulfing")
-
-        if is_engulfing_bearish(current, prev):
-            patterns.append("bearish_engulfing")
+        mask |= _engulfing_kind(current, candles[-2])
 
     # Three candle patterns
     if len(candles) >= 3:
@@ -573,15 +819,134 @@ def detect_candle_pattern(
         candle3 = candles[-1]
 
         if is_morning_star(candle1, candle2, candle3):
-            patterns.append("morning_star")
+            mask |= PATTERN_MORNING_STAR
 
         if is_evening_star(candle1, candle2, candle3):
-            patterns.append("evening_star")
+            mask |= PATTERN_EVENING_STAR
 
         if is_three_white_soldiers(candle1, candle2, candle3):
-            patterns.append("three_white_soldiers")
+            mask |= PATTERN_THREE_WHITE_SOLDIERS
 
         if is_three_black_crows(candle1, candle2, candle3):
-            patterns.append("three_black_crows")
+            mask |= PATTERN_THREE_BLACK_CROWS
+
+    return mask
+
+
+def pattern_mask_to_names(mask: int) -> list[str]:
+    """
+    Convert a pattern bitmask to pattern names.
+
+    Args:
+        mask: Bitmask of PATTERN_* flags.
 
-    return patterns
+    Returns:
+        Pattern names in bit order.
+    """
+    return [name for bit, name in enumerate(PATTERN_NAMES) if mask >> bit & 1]
+
+
+def detect_candle_pattern(
+    candles: list[ResampledCandleData],
+) -> list[str]:
+    """
+    Detect all applicable candle patterns.
+
+    Args:
+        candles: List of candles (1-3 candles depending on pattern).
+
+    Returns:
+        List of detected pattern names.
+    """
+    mask = detect_candle_pattern_mask(candles)
+    return pattern_mask_to_names(mask) if mask else []
+
+
+# === Batch Pattern Scan ===
+
+
+def detect_patterns_batch(
+    opens: Sequence[float],
+    highs: Sequence[float],
+    lows: Sequence[float],
+    closes: Sequence[float],
+) -> list[int]:
+    """
+    Scan a candle history for all patterns in a single pass.
+
+    Float counterpart of calling detect_candle_pattern on every prefix of
+    the history. Each candle gets a bitmask of PATTERN_* flags; use
+    PATTERN_NAMES to map bit positions back to pattern names.
+
+    Args:
+        opens: Open prices (oldest first).
+        highs: High prices.
+        lows: Low prices.
+        closes: Close prices.
+
+    Returns:
+        List of pattern bitmasks, one per candle.
+
+    Raises:
+        ValueError: If series lengths differ.
+    """
+    n = len(opens)
+    if not (len(highs) == len(lows) == len(closes) == n):
+        raise ValueError("Price series must have same length")
+
+    masks = [0] * n
+    # Per-candle "small body" flag (doji at 0.3 threshold) for star patterns
+    small = [False] * n
+
+    for i in range(n):
+        o = opens[i]
+        c = closes[i]
+        body_high = max(o, c)
+        body_low = min(o, c)
+        body = body_high - body_low
+        rng = highs[i] - lows[i]
+        upper_wick = highs[i] - body_high
+        lower_wick = body_low - lows[i]
+
+        mask = 0
+        if rng == 0:
+            mask |= PATTERN_DOJI
+            small[i] = True
+        else:
+            ratio = body / rng
+            if ratio <= 0.1:
+                mask |= PATTERN_DOJI
+            small[i] = ratio <= 0.3
+            if body != 0 and ratio <= 0.3:
+                if lower_wick / body >= 2.0 and upper_wick < body:
+                    mask |= PATTERN_HAMMER
+                if upper_wick / body >= 2.0 and lower_wick < body:
+                    mask |= PATTERN_INVERTED_HAMMER | PATTERN_SHOOTING_STAR
+
+        if i >= 1:
+            po = opens[i - 1]
+            pc = closes[i - 1]
+            if c > o and pc < po and o <= pc and c >= po:
+                mask |= PATTERN_BULLISH_ENGULFING
+            if c < o and pc > po and c <= po and o >= pc:
+                mask |= PATTERN_BEARISH_ENGULFING
+
+        if i >= 2:
+            o1 = opens[i - 2]
+            c1 = closes[i - 2]
+            o2 = opens[i - 1]
+            c2 = closes[i - 1]
+            if small[i - 1]:
+                first_midpoint = (o1 + c1) / 2
+                if c1 < o1 and c > o and c > first_midpoint:
+                    mask |= PATTERN_MORNING_STAR
+                if c1 > o1 and c < o and c < first_midpoint:
+                    mask |= PATTERN_EVENING_STAR
+            if c1 > o1 and c2 > o2 and c > o and c1 >= o2 >= o1 and c2 >= o >= o2 and c1 < c2 < c:
+                mask |= PATTERN_THREE_WHITE_SOLDIERS
+            if c1 < o1 and c2 < o2 and c < o and c1 <= o2 <= o1 and c2 <= o <= o2 and c1 > c2 > c:
+                mask |= PATTERN_THREE_BLACK_CROWS
+
+        masks[i] = mask
+
+    return masks
@@ -4,9 +4,16 @@ Shared utility functions for advanced data preparation.
 Pure helper functions for common operations across modules.
 """
 
+from collections.abc import Iterator
 from decimal import Decimal
+from functools import lru_cache
+from itertools import repeat
+from operator import mod
 from typing import Any
 
+# Decimal first: the common case across this codebase
+_NUMERIC_TYPES = (Decimal, int, float)
+
 
 def safe_divide(numerator: Decimal, denominator: Decimal, default: Decimal = Decimal(0)) -> Decimal:
     """
@@ -20,9 +27,7 @@ def safe_divide(numerator: Decimal, denominator: Decimal, default: Decimal = Dec
     Returns:
         Division result or default.
     """
-    if denominator == 0:
-        return default
-    return numerator / denominator
+    return numerator / denominator if denominator else default
 
 
 def clamp(value: Decimal, min_val: Decimal, max_val: Decimal) -> Decimal:
@@ -37,7 +42,10 @@ def clamp(value: Decimal, min_val: Decimal, max_val: Decimal) -> Decimal:
     Returns:
         Clamped value.
     """
-    return max(min_val, min(value, max_val))
+    # Same order as max(min_val, min(value, max_val)): min_val wins if bounds are inverted
+    if value > max_val:
+        value = max_val
+    return min_val if value < min_val else value
 
 
 def round_to_precision(value: Decimal, precision: int) -> Decimal:
@@ -51,8 +59,13 @@ def round_to_precision(value: Decimal, precision: int) -> Decimal:
     Returns:
         Rounded value.
     """
-    quantizer = Decimal(10) ** -precision
-    return value.quantize(quantizer)
+    return value.quantize(_quantizer(precision))
+
+
+@lru_cache(maxsize=32)
+def _quantizer(precision: int) -> Decimal:
+    """Quantization exponent for a number of decimal places (memoized)."""
+    return Decimal(10) ** -precision
 
 
 def is_close(a: Decimal, b: Decimal, tolerance: Decimal = Decimal("0.0001")) -> bool:
@@ -81,8 +94,12 @@ def validate_positive(value: Any, name: str) -> None:
     Raises:
         ValueError: If value is not positive.
     """
-    if not isinstance(value, (int, float, Decimal)) or value <= 0:
-        raise ValueError(f"{name} must be positive, got {value}")
+    if type(value) is Decimal:
+        if value > 0:
+            return
+    elif isinstance(value, _NUMERIC_TYPES) and value > 0:
+        return
+    raise ValueError(f"{name} must be positive, got {value}")
 
 
 def validate_non_negative(value: Any, name: str) -> None:
@@ -96,8 +113,12 @@ def validate_non_negative(value: Any, name: str) -> None:
     Raises:
         ValueError: If value is negative.
     """
-    if not isinstance(value, (int, float, Decimal)) or value < 0:
-        raise ValueError(f"{name} must be non-negative, got {value}")
+    if type(value) is Decimal:
+        if value >= 0:
+            return
+    elif isinstance(value, _NUMERIC_TYPES) and value >= 0:
+        return
+    raise ValueError(f"{name} must be non-negative, got {value}")
 
 
 def format_decimal(value: Decimal, decimals: int = 8) -> str:
@@ -139,21 +160,31 @@ def timestamps_aligned(timestamps: list[int], timeframe_ms: int) -> bool:
     Returns:
         True if all timestamps are aligned.
     """
-    return all(ts % timeframe_ms == 0 for ts in timestamps)
+    # map() keeps the modulo loop in C; any non-zero remainder means misaligned
+    return not any(map(mod, timestamps, repeat(timeframe_ms)))
 
 
-def batch_to_chunks(items: list[Any], chunk_size: int) -> list[list[Any]]:
+def batch_to_chunks(items: list[Any], chunk_size: int) -> Iterator[list[Any]]:
     """
-    Split list into chunks of specified size.
+    Split list into chunks of specified size, lazily.
 
     Args:
         items: List of items.
         chunk_size: Size of each chunk.
 
     Returns:
-        List of chunks.
+        Iterator over chunks (each a list slice).
+
+    Raises:
+        ValueError: If chunk_size is not positive (raised immediately).
     """
     if chunk_size <= 0:
         raise ValueError(f"Chunk size must be positive, got {chunk_size}")
 
-    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    return _iter_chunks(items, chunk_size)
+
+
+def _iter_chunks(items: list[Any], chunk_size: int) -> Iterator[list[Any]]:
+    """Yield successive chunk_size slices of items."""
+    for i in range(0, len(items), chunk_size):
+        yield items[i : i + chunk_size]
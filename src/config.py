@@ -14,12 +14,19 @@ Usage:
     api_key = get_secret("binance.api_key")
 """
 
+import operator
 import os
+from functools import lru_cache, reduce
 from pathlib import Path
-from typing import Any, TypedDict, cast
+from typing import Any, NotRequired, TypedDict, cast
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # === Configuration Type Definitions ===
 
 
@@ -55,6 +62,7 @@ class ReliabilityConfigData(TypedDict):
     max_delay_ms: int
     failure_threshold: int
     recovery_timeout_s: float
+    shutdown_timeout_s: NotRequired[float]
 
 
 class StorageConfigDefaultsData(TypedDict):
@@ -95,6 +103,11 @@ _config: AppConfigData | None = None
 _secrets: dict[str, Any] | None = None
 _config_dir: Path = Path(__file__).parent.parent / "configs"
 
+# Dot-notation key paths of _config, rebuilt on load: leaf values, and the
+# nested section dicts (handed out only as copies, see get_config)
+_flat_config: dict[str, Any] = {}
+_flat_sections: dict[str, dict[str, Any]] = {}
+
 
 def _load_yaml(file_path: Path) -> dict[str, Any]:
     """
@@ -109,8 +122,9 @@ def _load_yaml(file_path: Path) -> dict[str, Any]:
     Raises:
         FileNotFoundError: If file doesn't exist.
     """
-    with open(file_path) as f:
-        return yaml.safe_load(f) or {}
+    # Read in one call and let the loader decode the bytes (UTF-8/BOM aware),
+    # avoiding the buffered text-IO wrapper for these small files.
+    return yaml.load(file_path.read_bytes(), Loader=_YamlLoader) or {}
 
 
 def load_config(config_path: Path | None = None) -> AppConfigData:
@@ -131,9 +145,54 @@ def load_config(config_path: Path | None = None) -> AppConfigData:
         config_path = _config_dir / "default.yaml"
 
     _config = cast(AppConfigData, _load_yaml(config_path))
+    _flat_config.clear()
+    _flat_sections.clear()
+    _flatten_into(_flat_config, _flat_sections, _config, "")
     return _config
 
 
+def _flatten_into(
+    flat: dict[str, Any], sections: dict[str, dict[str, Any]], node: Any, prefix: str
+) -> None:
+    """
+    Index every key path of a nested config dict by its dot-notation key.
+
+    Leaves go to flat ("binance.ws_url" -> value); nested dicts go to sections
+    ("binance" -> dict) and are walked further.
+
+    Args:
+        flat: Output mapping of leaf values.
+        sections: Output mapping of section dicts.
+        node: Current config node.
+        prefix: Dot-notation path of node ("" for the root).
+    """
+    for name, value in node.items():
+        key = f"{prefix}.{name}" if prefix else str(name)
+        if isinstance(value, dict):
+            sections[key] = value
+            _flatten_into(flat, sections, value, key)
+        else:
+            flat[key] = value
+
+
+def _copy_section(section: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy a config section, recursing into nested sections.
+
+    Leaf values are shared with the loaded config.
+
+    Args:
+        section: Section dict from the loaded config.
+
+    Returns:
+        Independent dict structure with the same keys and leaves.
+    """
+    return {
+        name: _copy_section(value) if isinstance(value, dict) else value
+        for name, value in section.items()
+    }
+
+
 def load_secrets(secrets_path: Path | None = None) -> dict[str, Any]:
     """
     Load secrets from YAML file.
@@ -160,6 +219,12 @@ def get_config(key: str, default: Any = None) -> Any:
     """
     Get configuration value by dot-notation key.
 
+    Values come from a dot-key index built once per load. Section keys (e.g.
+    "binance") return a fresh copy of the section, so mutating it never
+    leaves later "binance.ws_url" lookups stale; change config by loading
+    it again. Hot paths should look up leaf keys, which are a single dict
+    hit and are not copied.
+
     Args:
         key: Dot-notation key (e.g., "binance.ws_url").
         default: Default value if key not found.
@@ -171,19 +236,17 @@ def get_config(key: str, default: Any = None) -> Any:
         ws_url = get_config("binance.ws_url")
         timeout = get_config("binance.http_timeout_s", 30)
     """
-    global _config
-
-    if _config is None:
-        load_config()
-
-    value: Any = _config
-    for part in key.split("."):
-        if isinstance(value, dict) and part in value:
-            value = value[part]
-        else:
-            return default
-
-    return value
+    try:
+        return _flat_config[key]
+    except KeyError:
+        # Only sections and misses get here; leaf hits are a single dict lookup.
+        section = _flat_sections.get(key)
+        if section is not None:
+            return _copy_section(section)
+        if _config is None:
+            load_config()
+            return get_config(key, default)
+        return default
 
 
 def get_secret(key: str, env_override: str | None = None) -> str | None:
@@ -207,13 +270,10 @@ def get_secret(key: str, env_override: str | None = None) -> str | None:
     """
     global _secrets
 
-    # Check environment variable first
-    if env_override:
-        env_value = os.environ.get(env_override)
-    else:
-        env_key = key.replace(".", "_").upper()
-        env_value = os.environ.get(env_key)
+    env_key, parts = _derive_secret_key(key)
 
+    # Check environment variable first
+    env_value = os.environ.get(env_override or env_key)
     if env_value:
         return env_value
 
@@ -221,22 +281,35 @@ def get_secret(key: str, env_override: str | None = None) -> str | None:
     if _secrets is None:
         load_secrets()
 
-    value: Any = _secrets
-    for part in key.split("."):
-        if isinstance(value, dict) and part in value:
-            value = value[part]
-        else:
-            return None
+    try:
+        value = reduce(operator.getitem, parts, cast(Any, _secrets))
+    except (KeyError, TypeError):
+        return None
 
     return value if isinstance(value, str) else None
 
 
+@lru_cache(maxsize=128)
+def _derive_secret_key(key: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Derive environment variable name and path parts for a secret key.
+
+    Args:
+        key: Dot-notation key (e.g., "binance.api_key").
+
+    Returns:
+        Tuple of (env var name, key parts), e.g. ("BINANCE_API_KEY", ("binance", "api_key")).
+    """
+    return key.replace(".", "_").upper(), tuple(key.split("."))
+
+
 def get_full_config() -> AppConfigData:
     """
     Get full configuration dictionary.
 
     Returns:
-        Complete configuration.
+        Complete configuration. This is the loaded config itself, not a copy;
+        do not mutate it, as get_config reads an index built at load time.
     """
     global _config
 
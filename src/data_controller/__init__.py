@@ -35,98 +35,148 @@ Example usage:
     ])
 """
 
-from src.data_controller.controller import (
-    create_controller,
-    create_strategy_feed,
-    fetch_historical,
-    fetch_orderbook_snapshot,
-    get_all_provider_health,
-    get_provider_health,
-    get_provider_status,
-    start_controller,
-    stop_controller,
-    subscribe,
-    unsubscribe,
-)
-from src.data_controller.event_bus import (
-    EVENT_CANDLE,
-    EVENT_ERROR,
-    EVENT_ORDERBOOK_DELTA,
-    EVENT_ORDERBOOK_SNAPSHOT,
-    EVENT_STATUS_CHANGE,
-    EVENT_TICK,
-    EVENT_TRADE,
-    clear_subscribers,
-    create_event_bus,
-    emit_event,
-    emit_event_async,
-    get_event_stats,
-    subscribe_event,
-    subscribe_event_async,
-)
-from src.data_controller.replay import (
-    create_replay_recorder,
-    record_event,
-    replay_from_file,
-    replay_from_records,
-    replay_iterator,
-    save_recording,
-    start_recording,
-    stop_recording,
-)
-from src.data_controller.storage import (
-    buffer_record,
-    create_storage_buffer,
-    flush_buffer,
-    get_storage_stats,
-    pipe_to_storage,
-    start_storage_buffer,
-    stop_storage_buffer,
-)
-
-__all__ = [
-    # Controller
-    "create_controller",
-    "start_controller",
-    "stop_controller",
-    "subscribe",
-    "unsubscribe",
-    "fetch_historical",
-    "fetch_orderbook_snapshot",
-    "get_provider_status",
-    "get_provider_health",
-    "get_all_provider_health",
-    "create_strategy_feed",
-    # Event Bus
-    "create_event_bus",
-    "emit_event",
-    "emit_event_async",
-    "subscribe_event",
-    "subscribe_event_async",
-    "get_event_stats",
-    "clear_subscribers",
-    "EVENT_TRADE",
-    "EVENT_CANDLE",
-    "EVENT_TICK",
-    "EVENT_ORDERBOOK_SNAPSHOT",
-    "EVENT_ORDERBOOK_DELTA",
-    "EVENT_ERROR",
-    "EVENT_STATUS_CHANGE",
-    # Replay
-    "replay_from_file",
-    "replay_from_records",
-    "replay_iterator",
-    "create_replay_recorder",
-    "start_recording",
-    "stop_recording",
-    "record_event",
-    "save_recording",
-    # Storage
-    "create_storage_buffer",
-    "start_storage_buffer",
-    "stop_storage_buffer",
-    "buffer_record",
-    "flush_buffer",
-    "get_storage_stats",
-    "pipe_to_storage",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Eager imports for type checkers only; at runtime names resolve lazily below.
+    from src.data_controller.controller import (
+        create_controller,
+        create_strategy_feed,
+        fetch_historical,
+        fetch_orderbook_snapshot,
+        get_all_provider_health,
+        get_provider_health,
+        get_provider_status,
+        set_handlers,
+        start_controller,
+        stop_controller,
+        subscribe,
+        unsubscribe,
+    )
+    from src.data_controller.event_bus import (
+        EVENT_CANDLE,
+        EVENT_ERROR,
+        EVENT_ORDERBOOK_DELTA,
+        EVENT_ORDERBOOK_SNAPSHOT,
+        EVENT_STATUS_CHANGE,
+        EVENT_TICK,
+        EVENT_TRADE,
+        clear_subscribers,
+        create_event_bus,
+        emit_event,
+        emit_event_async,
+        get_event_stats,
+        subscribe_event,
+        subscribe_event_async,
+    )
+    from src.data_controller.replay import (
+        create_replay_recorder,
+        record_event,
+        replay_from_file,
+        replay_from_records,
+        replay_iterator,
+        save_recording,
+        start_recording,
+        stop_recording,
+    )
+    from src.data_controller.storage import (
+        buffer_record,
+        buffer_records,
+        create_storage_buffer,
+        flush_buffer,
+        get_storage_stats,
+        pipe_to_storage,
+        start_storage_buffer,
+        stop_storage_buffer,
+    )
+
+# Public names by defining submodule. Submodules are imported on first
+# attribute access (PEP 562), so e.g. using only the event bus or replay does
+# not pull in the controller, providers and aiohttp.
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "src.data_controller.controller": (
+        "create_controller",
+        "create_strategy_feed",
+        "fetch_historical",
+        "fetch_orderbook_snapshot",
+        "get_all_provider_health",
+        "get_provider_health",
+        "get_provider_status",
+        "set_handlers",
+        "start_controller",
+        "stop_controller",
+        "subscribe",
+        "unsubscribe",
+    ),
+    "src.data_controller.event_bus": (
+        "EVENT_CANDLE",
+        "EVENT_ERROR",
+        "EVENT_ORDERBOOK_DELTA",
+        "EVENT_ORDERBOOK_SNAPSHOT",
+        "EVENT_STATUS_CHANGE",
+        "EVENT_TICK",
+        "EVENT_TRADE",
+        "clear_subscribers",
+        "create_event_bus",
+        "emit_event",
+        "emit_event_async",
+        "get_event_stats",
+        "subscribe_event",
+        "subscribe_event_async",
+    ),
+    "src.data_controller.replay": (
+        "create_replay_recorder",
+        "record_event",
+        "replay_from_file",
+        "replay_from_records",
+        "replay_iterator",
+        "save_recording",
+        "start_recording",
+        "stop_recording",
+    ),
+    "src.data_controller.storage": (
+        "buffer_record",
+        "buffer_records",
+        "create_storage_buffer",
+        "flush_buffer",
+        "get_storage_stats",
+        "pipe_to_storage",
+        "start_storage_buffer",
+        "stop_storage_buffer",
+    ),
+}
+
+_LAZY_EXPORTS: dict[str, str] = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+# Derived, so the export list cannot drift from the lazy-load table
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve a public name by importing its submodule on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The exported object (cached in module globals afterwards).
+
+    Raises:
+        AttributeError: If name is not exported by this package.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names, including not-yet-loaded lazy exports."""
+    return sorted(set(globals()) | set(__all__))
@@ -6,12 +6,16 @@ normalized market data to downstream components via callbacks or event bus.
 
 import asyncio
 import logging
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import Executor
 from typing import Any, cast
 
+from src.config import get_config
 from src.data_controller.event_bus import (
     EVENT_CANDLE,
     EVENT_ERROR,
+    EVENT_ORDERBOOK_DELTA,
+    EVENT_ORDERBOOK_SNAPSHOT,
     EVENT_STATUS_CHANGE,
     EVENT_TICK,
     EVENT_TRADE,
@@ -43,12 +47,16 @@ from src.types import (
 
 logger = logging.getLogger(__name__)
 
+# Used when the loaded config has no reliability.shutdown_timeout_s
+_DEFAULT_SHUTDOWN_TIMEOUT_S = 5.0
+
 
 def create_controller(
     provider_configs: Sequence[ProviderConfigData],
     handlers: HandlersData | None = None,
     event_bus_config: EventBusConfigData | None = None,
     storage_config: StorageConfigData | None = None,
+    handler_executor: Executor | None = None,
 ) -> dict[str, Any]:
     """
     Create Data Controller state container.
@@ -58,19 +66,25 @@ def create_controller(
         handlers: Optional event callback handlers.
         event_bus_config: Optional event bus configuration.
         storage_config: Optional storage layer configuration.
+        handler_executor: Optional executor for blocking data handlers. When set,
+            on_trade/on_candle/on_tick/on_orderbook_* run on it instead of the event
+            loop. Use a single worker to keep per-event ordering. The caller owns
+            and shuts down the executor.
 
     Returns:
         Controller state dictionary.
     """
     providers: dict[str, dict[str, Any]] = {}
+    provider_ops: dict[str, dict[str, Callable[..., Any]]] = {}
 
     for config in provider_configs:
         name = config["name"]
-        if name == "binance" or name.startswith("binance"):
-            providers[name] = binance.create_binance_provider(config)
-        # Add more providers here as needed
-        else:
+        ops = _resolve_provider_ops(name)
+        if ops is None:
             logger.warning(f"Unknown provider: {name}")
+            continue
+        providers[name] = ops["create"](config)
+        provider_ops[name] = ops
 
     # Create internal event bus for routing
     event_bus = create_event_bus()
@@ -80,19 +94,48 @@ def create_controller(
     if storage_config and storage_config.get("enabled", False):
         storage_buffer = create_storage_buffer(storage_config)
 
+    handlers = handlers or {}
+
     return {
         "providers": providers,
-        "handlers": handlers or {},
+        "provider_ops": provider_ops,
+        "handlers": handlers,
+        "handler_executor": handler_executor,
+        "dispatch_table": _build_dispatch_table(handlers, handler_executor),
+        "control_handlers": _build_control_handlers(handlers),
         "event_bus": event_bus,
         "event_bus_config": event_bus_config,
+        "external_emit": event_bus_config.get("emit") if event_bus_config else None,
         "storage_buffer": storage_buffer,
         "storage_config": storage_config,
+        "shutdown_timeout_s": get_config(
+            "reliability.shutdown_timeout_s", _DEFAULT_SHUTDOWN_TIMEOUT_S
+        ),
         "running": False,
         "tasks": [],
         "mode": "live",  # live, historical, replay
     }
 
 
+def set_handlers(state: dict[str, Any], handlers: HandlersData) -> None:
+    """
+    Replace the controller's event callback handlers.
+
+    Direct, status change and error handlers are resolved into lookup tables
+    when the controller is created, so use this instead of mutating
+    state["handlers"] in place.
+
+    Args:
+        state: Controller state container.
+        handlers: New event callback handlers.
+
+    Side effects: Replaces handlers and rebuilds the handler tables.
+    """
+    state["handlers"] = handlers
+    state["dispatch_table"] = _build_dispatch_table(handlers, state.get("handler_executor"))
+    state["control_handlers"] = _build_control_handlers(handlers)
+
+
 async def start_controller(state: dict[str, Any]) -> None:
     """
     Start the Data Controller, connect all providers.
@@ -111,12 +154,11 @@ async def start_controller(state: dict[str, Any]) -> None:
     # Connect all providers
     for name, provider_state in state["providers"].items():
         try:
-            if name == "binance" or name.startswith("binance"):
-                await binance.connect_binance(provider_state)
+            await state["provider_ops"][name]["connect"](provider_state)
 
-                # Start message processing loop
-                task = asyncio.create_task(_process_provider_messages(state, name, provider_state))
-                state["tasks"].append(task)
+            # Start message processing loop
+            task = asyncio.create_task(_process_provider_messages(state, name, provider_state))
+            state["tasks"].append(task)
 
             _emit_status_change(state, name, "disconnected", provider_state["status"])
             logger.info(f"Provider {name} started")
@@ -133,28 +175,37 @@ async def stop_controller(state: dict[str, Any]) -> None:
     Args:
         state: Controller state container.
 
-    Side effects: Cancels tasks, disconnects providers.
+    Side effects: Cancels tasks, disconnects providers, flushes storage.
     """
     state["running"] = False
 
     # Cancel all message processing tasks
-    for task in state["tasks"]:
+    tasks = state["tasks"]
+    for task in tasks:
         task.cancel()
 
-    # Wait for tasks to complete
-    if state["tasks"]:
-        await asyncio.gather(*state["tasks"], return_exceptions=True)
-    state["tasks"].clear()
+    # Wait for tasks to complete, bounded so a stuck close cannot hang shutdown
+    timeout_s = state["shutdown_timeout_s"]
+    pending: set[asyncio.Task[Any]] = set()
+    if tasks:
+        _, pending = await asyncio.wait(tasks, timeout=timeout_s)
+    tasks.clear()
 
-    # Disconnect all providers
+    # Disconnect all providers; closing their sockets unblocks stuck tasks
     for name, provider_state in state["providers"].items():
         try:
-            if name == "binance" or name.startswith("binance"):
-                await binance.disconnect_binance(provider_state)
+            await state["provider_ops"][name]["disconnect"](provider_state)
         except Exception as e:
             logger.error(f"Error disconnecting provider {name}: {e}")
 
-    # Stop storage buffer
+    if pending:
+        for task in pending:
+            task.cancel()
+        _, pending = await asyncio.wait(pending, timeout=timeout_s)
+        if pending:
+            logger.warning(f"{len(pending)} provider task(s) still running after {timeout_s}s")
+
+    # Final flush only once provider tasks can no longer buffer records
     if state.get("storage_buffer"):
         await stop_storage_buffer(state["storage_buffer"])
 
@@ -181,8 +232,7 @@ async def subscribe(
     if not provider_state:
         raise ValueError(f"Unknown provider: {provider_name}")
 
-    if provider_name == "binance" or provider_name.startswith("binance"):
-        await binance.subscribe_binance(provider_state, subscriptions)
+    await state["provider_ops"][provider_name]["subscribe"](provider_state, subscriptions)
 
 
 async def unsubscribe(
@@ -202,8 +252,7 @@ async def unsubscribe(
     if not provider_state:
         raise ValueError(f"Unknown provider: {provider_name}")
 
-    if provider_name == "binance" or provider_name.startswith("binance"):
-        await binance.unsubscribe_binance(provider_state, subscriptions)
+    await state["provider_ops"][provider_name]["unsubscribe"](provider_state, subscriptions)
 
 
 async def fetch_historical(
@@ -228,19 +277,21 @@ async def fetch_historical(
 
     data_type = request["data_type"]
 
-    if provider_name == "binance" or provider_name.startswith("binance"):
-        if data_type == "candle":
-            async for candle in binance.fetch_binance_historical_candles(provider_state, request):
-                # Optionally buffer to storage
-                if state.get("storage_buffer"):
-                    buffer_record(state["storage_buffer"], candle)
-                yield candle
+    ops = state["provider_ops"][provider_name]
+    records: AsyncIterator[MarketDataRecord]
+    if data_type == "candle":
+        records = ops["fetch_historical_candles"](provider_state, request)
+    elif data_type == "trade":
+        records = ops["fetch_historical_trades"](provider_state, request)
+    else:
+        return
 
-        elif data_type == "trade":
-            async for trade in binance.fetch_binance_historical_trades(provider_state, request):
-                if state.get("storage_buffer"):
-                    buffer_record(state["storage_buffer"], trade)
-                yield trade
+    storage_buffer = state.get("storage_buffer")
+    async for record in records:
+        # Optionally buffer to storage
+        if storage_buffer:
+            buffer_record(storage_buffer, record)
+        yield record
 
 
 async def fetch_orderbook_snapshot(
@@ -265,10 +316,8 @@ async def fetch_orderbook_snapshot(
     if not provider_state:
         raise ValueError(f"Unknown provider: {provider_name}")
 
-    if provider_name == "binance" or provider_name.startswith("binance"):
-        return await binance.fetch_binance_orderbook_snapshot(provider_state, symbol, limit)
-
-    raise ValueError(f"Unsupported provider: {provider_name}")
+    fetch_snapshot = state["provider_ops"][provider_name]["fetch_orderbook_snapshot"]
+    return cast(OrderBookSnapshotData, await fetch_snapshot(provider_state, symbol, limit))
 
 
 def get_provider_status(state: dict[str, Any], provider_name: str) -> ProviderStatus:
@@ -311,25 +360,14 @@ def get_provider_health(state: dict[str, Any], provider_name: str) -> ProviderHe
             latency_ms=None,
         )
 
-    if provider_name == "binance" or provider_name.startswith("binance"):
-        health = binance.get_binance_health(provider_state)
-        return ProviderHealthData(
-            provider=health["provider"],
-            status=health["status"],
-            last_message_ms=health.get("last_message_ms"),
-            message_count=health.get("message_count", 0),
-            error_count=health.get("error_count", 0),
-            reconnect_count=health.get("reconnect_count", 0),
-            latency_ms=None,
-        )
-
+    health = state["provider_ops"][provider_name]["health"](provider_state)
     return ProviderHealthData(
-        provider=provider_name,
-        status=provider_state.get("status", "disconnected"),
-        last_message_ms=None,
-        message_count=0,
-        error_count=0,
-        reconnect_count=0,
+        provider=health["provider"],
+        status=health["status"],
+        last_message_ms=health.get("last_message_ms"),
+        message_count=health.get("message_count", 0),
+        error_count=health.get("error_count", 0),
+        reconnect_count=health.get("reconnect_count", 0),
         latency_ms=None,
     )
 
@@ -350,6 +388,38 @@ def get_all_provider_health(state: dict[str, Any]) -> list[ProviderHealthData]:
 # === Internal Functions ===
 
 
+# Provider operations, keyed by role, resolved once per provider at creation
+_BINANCE_OPS: dict[str, Callable[..., Any]] = {
+    "create": binance.create_binance_provider,
+    "connect": binance.connect_binance,
+    "disconnect": binance.disconnect_binance,
+    "reconnect": binance.reconnect_binance,
+    "subscribe": binance.subscribe_binance,
+    "unsubscribe": binance.unsubscribe_binance,
+    "iter_messages": binance.iter_binance_messages,
+    "fetch_historical_candles": binance.fetch_binance_historical_candles,
+    "fetch_historical_trades": binance.fetch_binance_historical_trades,
+    "fetch_orderbook_snapshot": binance.fetch_binance_orderbook_snapshot,
+    "health": binance.get_binance_health,
+}
+
+
+def _resolve_provider_ops(name: str) -> dict[str, Callable[..., Any]] | None:
+    """
+    Resolve the provider operations for a provider name.
+
+    Args:
+        name: Provider name (e.g. "binance", "binance_futures").
+
+    Returns:
+        Operations table, or None for unknown providers.
+    """
+    if name == "binance" or name.startswith("binance"):
+        return _BINANCE_OPS
+    # Add more providers here as needed
+    return None
+
+
 async def _process_provider_messages(
     controller_state: dict[str, Any],
     provider_name: str,
@@ -366,18 +436,19 @@ async def _process_provider_messages(
     Side effects: Invokes handlers, emits events.
     """
 
-    try:
-        if provider_name == "binance" or provider_name.startswith("binance"):
-            async for event in binance.iter_binance_messages(provider_state):
-                if not controller_state["running"]:
-                    break
+    ops = controller_state["provider_ops"][provider_name]
+    # Hoisted out of the per-message loop
+    iter_messages = ops["iter_messages"]
+    dispatch = _dispatch_event
 
-                event_type = event.get("type")
-                data = event.get("data")
+    try:
+        async for event in iter_messages(provider_state):
+            if not controller_state["running"]:
+                break
 
-                # Route to handlers
-                if event_type:
-                    _dispatch_event(controller_state, str(event_type), data)
+            # Route to handlers
+            if event_type := event.get("type"):
+                dispatch(controller_state, str(event_type), event.get("data"))
 
     except asyncio.CancelledError:
         logger.info(f"Message processing cancelled for {provider_name}")
@@ -388,7 +459,7 @@ async def _process_provider_messages(
         # Attempt reconnection if configured
         if controller_state["running"]:
             try:
-                await binance.reconnect_binance(provider_state)
+                await ops["reconnect"](provider_state)
                 # Restart message processing
                 task = asyncio.create_task(
                     _process_provider_messages(controller_state, provider_name, provider_state)
@@ -398,6 +469,108 @@ async def _process_provider_messages(
                 logger.error(f"Reconnection failed for {provider_name}: {reconnect_error}")
 
 
+# Event type -> (handler key, log label) for direct handler dispatch
+_HANDLER_ROUTES: dict[str, tuple[str, str]] = {
+    EVENT_TRADE: ("on_trade", "Trade"),
+    EVENT_CANDLE: ("on_candle", "Candle"),
+    EVENT_TICK: ("on_tick", "Tick"),
+    EVENT_ORDERBOOK_SNAPSHOT: ("on_orderbook_snapshot", "Orderbook snapshot"),
+    EVENT_ORDERBOOK_DELTA: ("on_orderbook_delta", "Orderbook delta"),
+}
+
+# Controller-originated events; handlers take (provider, value) and always run inline
+_CONTROL_ROUTES: dict[str, tuple[str, str]] = {
+    EVENT_STATUS_CHANGE: ("on_status_change", "Status change"),
+    EVENT_ERROR: ("on_error", "Error"),
+}
+
+
+def _build_dispatch_table(
+    handlers: HandlersData,
+    executor: Executor | None = None,
+) -> dict[str, tuple[Callable[[Any], Any], str]]:
+    """
+    Resolve direct handlers per event type.
+
+    Args:
+        handlers: Event callback handlers.
+        executor: Optional executor; handlers are submitted to it instead of called inline.
+
+    Returns:
+        Mapping of event type to (callable, log label) for configured handlers only.
+    """
+    by_key = cast(dict[str, Callable[[Any], None] | None], handlers)
+    table: dict[str, tuple[Callable[[Any], Any], str]] = {}
+    for event_type, (handler_key, label) in _HANDLER_ROUTES.items():
+        if handler := by_key.get(handler_key):
+            if executor is not None:
+                table[event_type] = (_offload_handler(executor, handler, label), label)
+            else:
+                table[event_type] = (handler, label)
+    return table
+
+
+def _build_control_handlers(
+    handlers: HandlersData,
+) -> dict[str, tuple[Callable[[str, Any], None], str]]:
+    """
+    Resolve status change and error handlers per event type.
+
+    Kept apart from the dispatch table: these take (provider, value) and are only
+    invoked by the controller itself, never for provider data events.
+
+    Args:
+        handlers: Event callback handlers.
+
+    Returns:
+        Mapping of event type to (callable, log label) for configured handlers only.
+    """
+    by_key = cast(dict[str, Callable[[str, Any], None] | None], handlers)
+    return {
+        event_type: (handler, label)
+        for event_type, (handler_key, label) in _CONTROL_ROUTES.items()
+        if (handler := by_key.get(handler_key))
+    }
+
+
+def _offload_handler(
+    executor: Executor,
+    handler: Callable[[Any], None],
+    label: str,
+) -> Callable[[Any], Any]:
+    """
+    Wrap a handler so each call is submitted to an executor.
+
+    Args:
+        executor: Executor that runs the handler.
+        handler: Handler callback.
+        label: Handler label for log messages.
+
+    Returns:
+        Callable that submits handler(data) and returns the future.
+    """
+
+    def submit(data: Any) -> Any:
+        return executor.submit(_run_handler, handler, label, data)
+
+    return submit
+
+
+def _run_handler(handler: Callable[[Any], None], label: str, data: Any) -> None:
+    """
+    Run a handler on an executor worker, logging failures.
+
+    Args:
+        handler: Handler callback.
+        label: Handler label for log messages.
+        data: Event data.
+    """
+    try:
+        handler(data)
+    except Exception as e:
+        logger.error(f"{label} handler error: {e}")
+
+
 def _dispatch_event(
     state: dict[str, Any],
     event_type: str,
@@ -411,56 +584,27 @@ def _dispatch_event(
         event_type: Event type string.
         data: Event data.
     """
-    handlers = state["handlers"]
-    event_bus = state["event_bus"]
-    event_bus_config = state.get("event_bus_config")
-
     # Buffer to storage
-    if state.get("storage_buffer") and data:
-        buffer_record(state["storage_buffer"], data)
+    if data and (storage_buffer := state.get("storage_buffer")):
+        buffer_record(storage_buffer, data)
 
-    # Call direct handlers
-    if event_type == "trade":
-        if handler := handlers.get("on_trade"):
-            try:
-                handler(data)
-            except Exception as e:
-                logger.error(f"Trade handler error: {e}")
-
-    elif event_type == "candle":
-        if handler := handlers.get("on_candle"):
-            try:
-                handler(data)
-            except Exception as e:
-                logger.error(f"Candle handler error: {e}")
-
-    elif event_type == "tick":
-        if handler := handlers.get("on_tick"):
-            try:
-                handler(data)
-            except Exception as e:
-                logger.error(f"Tick handler error: {e}")
-
-    elif event_type == "orderbook_snapshot":
-        if handler := handlers.get("on_orderbook_snapshot"):
-            try:
-                handler(data)
-            except Exception as e:
-                logger.error(f"Orderbook snapshot handler error: {e}")
-
-    elif event_type == "orderbook_delta" and (handler := handlers.get("on_orderbook_delta")):
+    # Call direct handler, resolved once in the dispatch table
+    route = state["dispatch_table"].get(event_type)
+    if route is not None:
+        handler, label = route
         try:
             handler(data)
         except Exception as e:
-            logger.error(f"Orderbook delta handler error: {e}")
+            logger.error(f"{label} handler error: {e}")
 
     # Emit to internal event bus
-    emit_event(event_bus, event_type, {"type": event_type, "data": data})
+    emit_event(state["event_bus"], event_type, {"type": event_type, "data": data})
 
-    # Emit to external event bus if configured
-    if event_bus_config and event_bus_config.get("emit"):
+    # Emit to external event bus if configured (own envelope, so subscriber
+    # mutations on the internal one do not leak)
+    if external_emit := state["external_emit"]:
         try:
-            event_bus_config["emit"](event_type, {"type": event_type, "data": data})
+            external_emit(event_type, {"type": event_type, "data": data})
         except Exception as e:
             logger.error(f"External event bus emit error: {e}")
 
@@ -472,13 +616,13 @@ def _emit_status_change(
     new_status: ProviderStatus,
 ) -> None:
     """Emit provider status change event."""
-    handlers = state["handlers"]
-
-    if handler := handlers.get("on_status_change"):
+    route = state["control_handlers"].get(EVENT_STATUS_CHANGE)
+    if route is not None:
+        handler, label = route
         try:
             handler(provider_name, new_status)
         except Exception as e:
-            logger.error(f"Status change handler error: {e}")
+            logger.error(f"{label} handler error: {e}")
 
     emit_event(
         state["event_bus"],
@@ -497,13 +641,13 @@ def _emit_error(
     error: Exception,
 ) -> None:
     """Emit error event."""
-    handlers = state["handlers"]
-
-    if handler := handlers.get("on_error"):
+    route = state["control_handlers"].get(EVENT_ERROR)
+    if route is not None:
+        handler, label = route
         try:
             handler(provider_name, error)
         except Exception as e:
-            logger.error(f"Error handler error: {e}")
+            logger.error(f"{label} handler error: {e}")
 
     emit_event(
         state["event_bus"],
@@ -110,7 +110,10 @@ def emit_event(
     """
     bus["event_count"] += 1
 
-    callbacks = bus["subscribers"].get(event_type, [])
+    callbacks = bus["subscribers"].get(event_type)
+    if not callbacks:
+        return
+
     for callback in callbacks:
         try:
             callback(data)
@@ -137,8 +140,7 @@ async def emit_event_async(
     bus["event_count"] += 1
 
     # Call sync subscribers first
-    callbacks = bus["subscribers"].get(event_type, [])
-    for callback in callbacks:
+    for callback in bus["subscribers"].get(event_type, ()):
         try:
             callback(data)
         except Exception as e:
@@ -146,7 +148,7 @@ async def emit_event_async(
             logger.error(f"Error in sync subscriber for {event_type}: {e}")
 
     # Then async subscribers
-    async_callbacks = bus["async_subscribers"].get(event_type, [])
+    async_callbacks = bus["async_subscribers"].get(event_type)
     if async_callbacks:
         tasks = []
         for callback in async_callbacks:
@@ -8,10 +8,15 @@ This module contains pure functions with no side effects for:
 - Sequence gap detection
 """
 
+import time
+from collections.abc import Callable
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from itertools import islice
+from operator import gt, lt
 from typing import Any
 
-from src.config import get_normalization_config, get_validation_config
+from src.config import get_config
 from src.types import Side
 
 
@@ -28,12 +33,30 @@ def to_decimal(value: Any) -> Decimal:
     Raises:
         ValueError: If conversion fails.
     """
+    value_type = type(value)
+    if value_type is Decimal:
+        return value  # type: ignore[no-any-return]
     try:
+        # Provider payloads carry numeric strings; str/int convert exactly without str().
+        if value_type is str or value_type is int:
+            return Decimal(value)
         return Decimal(str(value))
     except InvalidOperation as e:
         raise ValueError(f"Cannot convert {value!r} to Decimal") from e
 
 
+# Accepted side spellings -> normalized side. Upper-case forms are listed too so
+# the common provider spellings resolve with a single lookup.
+_BUY_SIDES = ("buy", "bid", "b", "long", "buyer")
+_SELL_SIDES = ("sell", "ask", "s", "short", "seller")
+_SIDE_ALIASES: dict[str, Side] = {
+    **dict.fromkeys(_BUY_SIDES, "buy"),
+    **dict.fromkeys([side.upper() for side in _BUY_SIDES], "buy"),
+    **dict.fromkeys(_SELL_SIDES, "sell"),
+    **dict.fromkeys([side.upper() for side in _SELL_SIDES], "sell"),
+}
+
+
 def normalize_side(raw_side: str) -> Side:
     """
     Normalize trade side to standard format.
@@ -47,12 +70,13 @@ def normalize_side(raw_side: str) -> Side:
     Raises:
         ValueError: If side cannot be determined.
     """
-    lowered = raw_side.lower().strip()
-    if lowered in ("buy", "bid", "b", "long", "buyer"):
-        return "buy"
-    if lowered in ("sell", "ask", "s", "short", "seller"):
-        return "sell"
-    raise ValueError(f"Unknown side: {raw_side}")
+    side = _SIDE_ALIASES.get(raw_side)
+    if side is None:
+        # Mixed case or padded input: normalize once and retry
+        side = _SIDE_ALIASES.get(raw_side.lower().strip())
+    if side is None:
+        raise ValueError(f"Unknown side: {raw_side}")
+    return side
 
 
 def normalize_symbol(symbol: str, provider: str) -> str:
@@ -66,12 +90,30 @@ def normalize_symbol(symbol: str, provider: str) -> str:
     Returns:
         Normalized symbol like 'BTC/USDT'.
     """
-    # Remove common separators and normalize to uppercase
-    clean = symbol.upper().replace("-", "").replace("_", "").replace("/", "")
+    # Symbols repeat on every message, so the split is memoized per (symbol, quotes).
+    # Quotes are part of the key so a config reload is picked up without a cache clear.
+    quotes = get_config("normalization.quote_currencies")
+    return _split_symbol(symbol, tuple(quotes))
+
 
-    # Get quote currencies from config
-    norm_config = get_normalization_config()
-    quotes = norm_config["quote_currencies"]
+# Separators stripped from provider symbols before quote matching
+_SYMBOL_STRIP_TABLE = str.maketrans("", "", "-_/")
+
+
+@lru_cache(maxsize=4096)
+def _split_symbol(symbol: str, quotes: tuple[str, ...]) -> str:
+    """
+    Split a provider symbol into BASE/QUOTE using the first matching quote.
+
+    Args:
+        symbol: Provider-specific symbol.
+        quotes: Quote currencies in priority order.
+
+    Returns:
+        Normalized symbol like 'BTC/USDT', or the uppercased input if no quote matches.
+    """
+    upper = symbol.upper()
+    clean = upper.translate(_SYMBOL_STRIP_TABLE)
 
     for quote in quotes:
         if clean.endswith(quote):
@@ -80,7 +122,7 @@ def normalize_symbol(symbol: str, provider: str) -> str:
                 return f"{base}/{quote}"
 
     # Return as-is if pattern not recognized
-    return symbol.upper()
+    return upper
 
 
 def denormalize_symbol(symbol: str, provider: str) -> str:
@@ -110,9 +152,9 @@ def validate_timestamp(timestamp_ms: int) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    validation_config = get_validation_config()
-    min_ts = validation_config["min_timestamp_ms"]
-    max_ts = validation_config["max_timestamp_ms"]
+    # Leaf keys skip the per-call copy a section lookup would make
+    min_ts: int = get_config("validation.min_timestamp_ms")
+    max_ts: int = get_config("validation.max_timestamp_ms")
     return min_ts <= timestamp_ms <= max_ts
 
 
@@ -195,18 +237,37 @@ def validate_orderbook_integrity(
         return False, f"Crossed book: bid {best_bid} >= ask {best_ask}"
 
     # Validate bid ordering (descending)
-    for i in range(1, len(bids)):
-        if bids[i][0] >= bids[i - 1][0]:
-            return False, f"Bids not sorted descending at index {i}"
+    bid_prices = [level[0] for level in bids]
+    if not all(map(gt, bid_prices, islice(bid_prices, 1, None))):
+        i = _first_unordered_index(bid_prices, gt)
+        return False, f"Bids not sorted descending at index {i}"
 
     # Validate ask ordering (ascending)
-    for i in range(1, len(asks)):
-        if asks[i][0] <= asks[i - 1][0]:
-            return False, f"Asks not sorted ascending at index {i}"
+    ask_prices = [level[0] for level in asks]
+    if not all(map(lt, ask_prices, islice(ask_prices, 1, None))):
+        i = _first_unordered_index(ask_prices, lt)
+        return False, f"Asks not sorted ascending at index {i}"
 
     return True, None
 
 
+def _first_unordered_index(prices: list[Decimal], ordered: Callable[[Any, Any], bool]) -> int:
+    """
+    Find the first index whose price breaks the expected ordering.
+
+    Args:
+        prices: Level prices in book order.
+        ordered: Comparison that must hold between each price and the next.
+
+    Returns:
+        Index of the first out-of-order price (0 if none).
+    """
+    for i in range(1, len(prices)):
+        if not ordered(prices[i - 1], prices[i]):
+            return i
+    return 0
+
+
 def get_current_timestamp_ms() -> int:
     """
     Get current Unix timestamp in milliseconds.
@@ -214,6 +275,4 @@ def get_current_timestamp_ms() -> int:
     Returns:
         Current timestamp in milliseconds.
     """
-    import time
-
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
@@ -8,6 +8,7 @@ Requires aiohttp: pip install aiohttp
 
 import asyncio
 import logging
+import time
 from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
@@ -699,11 +700,9 @@ async def process_binance_message(
     Returns:
         Parsed event dict with 'type' and 'data' keys, or None.
     """
-    import time
-
     if msg.type == aiohttp.WSMsgType.TEXT:
         state["message_count"] += 1
-        state["last_message_ms"] = int(time.time() * 1000)
+        state["last_message_ms"] = time.time_ns() // 1_000_000
 
         try:
             data = msg.json()
@@ -9,6 +9,7 @@ This module provides:
 
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
@@ -113,8 +114,6 @@ def create_rate_limiter(requests_per_second: int) -> RateLimiterStateData:
     Returns:
         Rate limiter state dictionary.
     """
-    import time
-
     return RateLimiterStateData(
         tokens=float(requests_per_second),
         max_tokens=requests_per_second,
@@ -132,8 +131,6 @@ async def acquire_rate_limit(limiter: RateLimiterStateData) -> None:
 
     Side effects: Updates token count, may sleep.
     """
-    import time
-
     now = time.monotonic()
     elapsed = now - limiter["last_refill"]
 
@@ -224,8 +221,6 @@ class CircuitBreaker:
 
     def record_failure(self) -> None:
         """Record failed operation, potentially open circuit."""
-        import time
-
         self._failure_count += 1
         self._last_failure_time = time.monotonic()
 
@@ -244,8 +239,6 @@ class CircuitBreaker:
             return True
 
         # Check if recovery timeout has passed
-        import time
-
         if self._last_failure_time is None:
             return True
 
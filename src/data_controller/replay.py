@@ -7,14 +7,23 @@ with configurable playback speed.
 import asyncio
 import json
 import logging
+import time
 from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any, cast
 
 from src.types import DataType, HandlersData
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# Parses one JSONL line (bytes); orjson when installed, stdlib json otherwise
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 async def replay_from_file(
     file_path: Path,
@@ -48,12 +57,12 @@ async def replay_from_file(
         "skipped": 0,
     }
 
-    with open(file_path) as f:
+    with open(file_path, "rb") as f:
         for line in f:
             if not line.strip():
                 continue
 
-            record = json.loads(line)
+            record = _loads(line)
             timestamp = record.get("timestamp_ms", 0)
 
             # Apply time filters
@@ -176,12 +185,12 @@ async def replay_iterator(
     Yields:
         Recorded event dictionaries.
     """
-    with open(file_path) as f:
+    with open(file_path, "rb") as f:
         for line in f:
             if not line.strip():
                 continue
 
-            record = json.loads(line)
+            record = _loads(line)
 
             if data_types and record.get("type") not in data_types:
                 continue
@@ -211,10 +220,8 @@ def start_recording(state: dict[str, Any]) -> None:
     Args:
         state: Recorder state.
     """
-    import time
-
     state["recording"] = True
-    state["start_time_ms"] = int(time.time() * 1000)
+    state["start_time_ms"] = time.time_ns() // 1_000_000
     state["records"].clear()
 
 
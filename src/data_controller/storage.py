@@ -7,7 +7,8 @@ Uses async iterator pattern for streaming data to storage.
 import asyncio
 import contextlib
 import logging
-from collections.abc import Sequence
+import time
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 from src.config import get_storage_defaults
@@ -28,8 +29,11 @@ def create_storage_buffer(
     Returns:
         Storage buffer state dictionary.
     """
+    storage_defaults = get_storage_defaults()
+
     return {
         "config": config,
+        "batch_size": config.get("batch_size", storage_defaults["batch_size"]),
         "buffer": [],
         "write_count": 0,
         "error_count": 0,
@@ -91,12 +95,34 @@ def buffer_record(state: dict[str, Any], record: MarketDataRecord) -> None:
     if not state["config"].get("enabled", False):
         return
 
-    state["buffer"].append(record)
+    buffer = state["buffer"]
+    buffer.append(record)
 
     # Check if we should flush immediately
-    storage_defaults = get_storage_defaults()
-    batch_size = state["config"].get("batch_size", storage_defaults["batch_size"])
-    if len(state["buffer"]) >= batch_size:
+    if len(buffer) >= state["batch_size"]:
+        asyncio.create_task(flush_buffer(state))
+
+
+def buffer_records(state: dict[str, Any], records: Iterable[MarketDataRecord]) -> None:
+    """
+    Add several records to the storage buffer at once.
+
+    Equivalent to calling buffer_record per record, but extends the buffer
+    in one call and schedules at most one flush for the whole batch.
+
+    Args:
+        state: Storage buffer state.
+        records: Market data records to buffer.
+
+    Side effects: Extends buffer.
+    """
+    if not state["config"].get("enabled", False):
+        return
+
+    buffer = state["buffer"]
+    buffer.extend(records)
+
+    if len(buffer) >= state["batch_size"]:
         asyncio.create_task(flush_buffer(state))
 
 
@@ -132,9 +158,7 @@ async def flush_buffer(state: dict[str, Any]) -> None:
         # Re-add records to buffer for retry
         state["buffer"].extend(records)
 
-    import time
-
-    state["last_flush_ms"] = int(time.time() * 1000)
+    state["last_flush_ms"] = time.time_ns() // 1_000_000
 
 
 async def _flush_loop(state: dict[str, Any]) -> None:
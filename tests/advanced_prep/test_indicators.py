@@ -16,8 +16,12 @@ from src.advanced_prep.indicators import (
     compute_wma,
     init_atr_state,
     init_ema_state,
+    init_rsi_state,
     update_atr_streaming,
+    update_ema_atr_streaming,
     update_ema_streaming,
+    update_rsi_streaming,
+    update_rsi_streaming_inplace,
 )
 
 
@@ -156,6 +160,51 @@ class TestATR:
         assert state.tr_window.is_full()
         assert state.value > Decimal(0)
 
+    def test_fused_ema_atr_streaming_matches_separate_updates(self) -> None:
+        """Test fused in-place update matches separate streaming updates."""
+        candles = [
+            (Decimal("110"), Decimal("90"), Decimal("100")),
+            (Decimal("120"), Decimal("95"), Decimal("110")),
+            (Decimal("115"), Decimal("92"), Decimal("105")),
+        ]
+
+        fast = init_ema_state(2, Decimal("100"))
+        slow = init_ema_state(3, Decimal("100"))
+        atr = init_atr_state(2)
+        fused_fast = init_ema_state(2, Decimal("100"))
+        fused_slow = init_ema_state(3, Decimal("100"))
+        fused_atr = init_atr_state(2)
+
+        for high, low, close in candles:
+            fast = update_ema_streaming(fast, close)
+            slow = update_ema_streaming(slow, close)
+            atr = update_atr_streaming(atr, high, low, close)
+            update_ema_atr_streaming(fused_fast, fused_slow, fused_atr, high, low, close)
+
+        assert fused_fast.value == fast.value
+        assert fused_slow.value == slow.value
+        assert fused_atr.value == atr.value
+        assert fused_atr.prev_close == atr.prev_close
+
+
+class TestRSI:
+    """Tests for RSI streaming updates."""
+
+    def test_rsi_inplace_matches_streaming(self) -> None:
+        """Test in-place RSI update matches the allocating streaming update."""
+        prices = [Decimal(x) for x in ["100", "102", "101", "104", "103", "99", "101", "105"]]
+
+        rsi = init_rsi_state(3, prices[0])
+        inplace = init_rsi_state(3, prices[0])
+
+        for price in prices[1:]:
+            rsi = update_rsi_streaming(rsi, price)
+            update_rsi_streaming_inplace(inplace, price)
+            assert inplace.value == rsi.value
+            assert inplace.avg_gain == rsi.avg_gain
+            assert inplace.avg_loss == rsi.avg_loss
+            assert inplace.prev_close == rsi.prev_close
+
 
 class TestVolatility:
     """Tests for volatility indicators."""
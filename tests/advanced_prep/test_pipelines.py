@@ -104,6 +104,27 @@ class TestMultiTimeframePipeline:
         assert snapshot["symbol"] == "BTCUSDT"
         assert "1m" in snapshot["candles"] or "5m" in snapshot["candles"]
 
+    def test_emitted_snapshot_not_mutated_by_later_ticks(self) -> None:
+        """Test emitted snapshots are independent objects, not a reused template."""
+        snapshots: list[MultiTimeframeSnapshotData] = []
+
+        config = PipelineConfig(
+            symbol="BTCUSDT",
+            timeframes_ms=[60000],
+        )
+
+        pipeline = MultiTimeframePipeline(config, on_multi_tf_ready=snapshots.append)
+
+        pipeline.process_tick(create_test_tick(60000, "50000"))
+        pipeline.process_tick(create_test_tick(120000, "50100"))
+        pipeline.process_tick(create_test_tick(180000, "50200"))
+
+        assert len(snapshots) == 2
+        assert snapshots[0] is not snapshots[1]
+        assert snapshots[0]["timestamp_ms"] == 120000
+        assert snapshots[0]["candles"]["1m"]["open"] == Decimal("50000")
+        assert snapshots[1]["candles"]["1m"]["open"] == Decimal("50100")
+
     def test_get_snapshot(self) -> None:
         """Test getting current snapshot."""
         config = PipelineConfig(
@@ -166,6 +187,26 @@ class TestMultiTimeframePipeline:
         snapshot = pipeline.get_snapshot()
         assert snapshot is None
 
+    def test_snapshot_after_reset(self) -> None:
+        """Test snapshots track timeframe states recreated by reset."""
+        config = PipelineConfig(
+            symbol="BTCUSDT",
+            timeframes_ms=[60000],
+        )
+
+        pipeline = MultiTimeframePipeline(config)
+
+        pipeline.process_tick(create_test_tick(60000, "50000"))
+        pipeline.process_tick(create_test_tick(120000, "50100"))
+        pipeline.reset()
+
+        pipeline.process_tick(create_test_tick(180000, "51000"))
+        pipeline.process_tick(create_test_tick(240000, "51100"))
+
+        snapshot = pipeline.get_snapshot()
+        assert snapshot is not None
+        assert snapshot["candles"]["1m"]["open"] == Decimal("51000")
+
     def test_candle_history(self) -> None:
         """Test candle history retrieval."""
         config = PipelineConfig(
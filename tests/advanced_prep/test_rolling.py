@@ -84,6 +84,29 @@ class TestRollingWindow:
         std_val = window.std()
         assert abs(std_val - Decimal("8.165")) < Decimal("0.01")
 
+    def test_std_sliding_large_offset(self) -> None:
+        """Test std stays accurate for large values after evictions."""
+        window = RollingWindow(3)
+        for x in ["1000000010", "1000000020", "1000000030", "1000000040", "1000000050"]:
+            window.append(Decimal(x))
+
+        # Window is [..30, ..40, ..50] -> population std = sqrt(200/3)
+        assert abs(window.std() - Decimal("8.16496580927726")) < Decimal("0.000001")
+
+    def test_std_long_stream_then_constant_window(self) -> None:
+        """Test std is exactly 0 for a flat window once re-anchored after many evictions."""
+        window = RollingWindow(5)
+        for i in range(100_000):
+            window.append(Decimal("60000.12") if i % 3 else Decimal("60000.13"))
+        for _ in range(5):
+            window.append(Decimal("60000.12"))
+
+        assert window.std() == Decimal(0)
+
+        window.append(Decimal("60000.13"))
+        # Between re-anchors the float update is approximate
+        assert abs(window.std() - Decimal("0.004")) < Decimal("1e-9")
+
     def test_sum(self) -> None:
         """Test rolling sum."""
         window = RollingWindow(3)
@@ -6,7 +6,11 @@ from decimal import Decimal
 
 from src.advanced_prep.indicators import compute_rsi, init_rsi_state, update_rsi_streaming
 from src.advanced_prep.transforms import (
+    PATTERN_BULLISH_ENGULFING,
+    PATTERN_DOJI,
     detect_candle_pattern,
+    detect_candle_pattern_mask,
+    detect_patterns_batch,
     is_doji,
     is_engulfing_bearish,
     is_engulfing_bullish,
@@ -16,6 +20,7 @@ from src.advanced_prep.transforms import (
     is_shooting_star,
     is_three_black_crows,
     is_three_white_soldiers,
+    pattern_mask_to_names,
 )
 from src.types import ResampledCandleData
 
@@ -176,3 +181,45 @@ class TestCandlePatterns:
         ]
         patterns = detect_candle_pattern(candles)
         assert "bullish_engulfing" in patterns
+
+    def test_detect_candle_pattern_mask(self) -> None:
+        """Test bitmask detection and name conversion."""
+        assert detect_candle_pattern_mask([]) == 0
+
+        candles = [
+            create_candle("105", "105", "100", "100"),
+            create_candle("99", "110", "98", "110"),
+        ]
+        mask = detect_candle_pattern_mask(candles)
+        assert mask & PATTERN_BULLISH_ENGULFING
+        assert not mask & PATTERN_DOJI
+        assert pattern_mask_to_names(mask) == detect_candle_pattern(candles)
+
+    def test_detect_patterns_batch_matches_detect_candle_pattern(self) -> None:
+        """Batch bitmask scan agrees with per-prefix pattern detection."""
+        rows = [
+            ("105", "105", "100", "100"),
+            ("100", "101", "99", "100"),
+            ("100", "110", "100", "108"),
+            ("99", "100", "90", "100"),
+            ("100", "110", "99", "99"),
+            ("105", "105", "100", "100"),
+            ("99", "110", "98", "110"),
+            ("100", "103", "100", "103"),
+            ("102", "106", "102", "106"),
+            ("105", "109", "105", "109"),
+            ("109", "109", "106", "106"),
+            ("107", "107", "103", "103"),
+            ("104", "104", "100", "100"),
+            ("100", "100", "100", "100"),
+        ]
+        candles = [create_candle(*row) for row in rows]
+        masks = detect_patterns_batch(
+            [float(c["open"]) for c in candles],
+            [float(c["high"]) for c in candles],
+            [float(c["low"]) for c in candles],
+            [float(c["close"]) for c in candles],
+        )
+
+        for i, mask in enumerate(masks):
+            assert pattern_mask_to_names(mask) == detect_candle_pattern(candles[: i + 1])
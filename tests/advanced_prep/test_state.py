@@ -0,0 +1,159 @@
+"""
+Tests for streaming state management.
+"""
+
+import pickle
+from decimal import Decimal
+
+from src.advanced_prep.state import (
+    StreamingState,
+    TimeframeState,
+    create_streaming_state,
+    get_indicator_snapshot,
+    get_indicator_values,
+    init_indicator_states,
+)
+from src.types import ResampledCandleData
+
+
+def create_test_candle(open_time_ms: int, close: str = "100") -> ResampledCandleData:
+    """Helper to create finalized test candle."""
+    return {
+        "open_time_ms": open_time_ms,
+        "close_time_ms": open_time_ms + 60000,
+        "open": Decimal(close),
+        "high": Decimal(close),
+        "low": Decimal(close),
+        "close": Decimal(close),
+        "volume": Decimal("1"),
+        "vwap": Decimal(close),
+        "tick_count": 1,
+        "is_finalized": True,
+    }
+
+
+class TestCandleHistory:
+    """Tests for candle history tracking."""
+
+    def test_history_capped_at_max_history(self) -> None:
+        """Test history keeps only the newest max_history candles."""
+        state = StreamingState(symbol="BTCUSDT")
+        state.timeframe_states[60000] = TimeframeState(timeframe_ms=60000, max_history=3)
+
+        for i in range(6):
+            state.update_candle(60000, create_test_candle(i * 60000, str(100 + i)))
+
+        # Last candle is current, previous five were pushed to history
+        history = state.get_candle_history(60000)
+        assert [c["close"] for c in history] == [Decimal("102"), Decimal("103"), Decimal("104")]
+
+    def test_history_passed_at_init_is_bounded(self) -> None:
+        """Test an initial candle_history is kept as a bounded deque with matching columns."""
+        candles = [create_test_candle(i * 60000, str(100 + i)) for i in range(5)]
+        tf_state = TimeframeState(timeframe_ms=60000, candle_history=candles, max_history=3)  # type: ignore[arg-type]
+
+        assert list(tf_state.candle_history) == candles[-3:]
+        assert tf_state.candle_history.maxlen == 3
+        assert list(tf_state.ohlc_columns[3]) == [102.0, 103.0, 104.0]
+
+    def test_history_count(self) -> None:
+        """Test retrieving the newest count candles."""
+        state = create_streaming_state("BTCUSDT", [60000])
+
+        for i in range(5):
+            state.update_candle(60000, create_test_candle(i * 60000, str(100 + i)))
+
+        assert [c["close"] for c in state.get_candle_history(60000, count=2)] == [
+            Decimal("102"),
+            Decimal("103"),
+        ]
+        assert len(state.get_candle_history(60000, count=10)) == 4
+        assert state.get_candle_history(120000) == []
+
+    def test_history_returns_copy(self) -> None:
+        """Test returned history is detached from internal state."""
+        state = create_streaming_state("BTCUSDT", [60000])
+        state.update_candle(60000, create_test_candle(0))
+        state.update_candle(60000, create_test_candle(60000))
+
+        history = state.get_candle_history(60000)
+        history.clear()
+
+        assert len(state.get_candle_history(60000)) == 1
+
+    def test_ohlc_columns_track_history(self) -> None:
+        """Test float OHLC columns mirror the bounded candle history."""
+        state = StreamingState(symbol="BTCUSDT")
+        state.timeframe_states[60000] = TimeframeState(timeframe_ms=60000, max_history=3)
+
+        for i in range(6):
+            state.update_candle(60000, create_test_candle(i * 60000, str(100 + i)))
+
+        opens, highs, lows, closes = state.get_ohlc_columns(60000)
+        assert closes == [102.0, 103.0, 104.0]
+        assert opens == highs == lows == closes
+        assert state.get_ohlc_columns(60000, count=2)[3] == [103.0, 104.0]
+        assert state.get_ohlc_columns(120000) == ([], [], [], [])
+
+
+class TestIndicatorStates:
+    """Tests for indicator state initialization."""
+
+    def test_init_indicator_states(self) -> None:
+        """Initialization replaces the immutable container with seeded states."""
+        tf_state = TimeframeState(timeframe_ms=60000)
+        tf_state.last_candle = create_test_candle(0, "100")
+        before = tf_state.indicators
+
+        init_indicator_states(tf_state, ema_fast=12, ema_slow=26, atr_period=14, rolling_window=20)
+
+        indicators = tf_state.indicators
+        assert indicators is not before
+        assert indicators.ema_fast is not None and indicators.ema_fast.value == Decimal("100")
+        assert indicators.ema_slow is not None and indicators.ema_slow.period == 26
+        assert indicators.atr is not None
+        assert indicators.rolling_window is not None
+        assert indicators.rsi is None
+
+    def test_indicator_snapshot_matches_values(self) -> None:
+        """Tuple snapshot carries the same values as the dict view."""
+        tf_state = TimeframeState(timeframe_ms=60000)
+        tf_state.last_candle = create_test_candle(0, "100")
+        init_indicator_states(tf_state, ema_fast=12, ema_slow=26, atr_period=14, rolling_window=2)
+        window = tf_state.indicators.rolling_window
+        assert window is not None
+        window.append(Decimal("100"))
+        window.append(Decimal("102"))
+
+        values = get_indicator_values(tf_state)
+        snapshot = get_indicator_snapshot(tf_state)
+
+        assert snapshot.ema_fast == values["ema_fast"]
+        assert snapshot.ema_slow == values["ema_slow"]
+        assert snapshot.rolling_mean == values["rolling_mean"] == Decimal("101")
+        assert snapshot.rolling_std == values["rolling_std"]
+        assert "atr" not in values and snapshot.atr is None
+        assert snapshot.rsi is None
+
+
+class TestPickling:
+    """Tests for streaming state snapshots."""
+
+    def test_streaming_state_pickle_round_trip(self) -> None:
+        """Pickled state restores candles, history bound and indicators."""
+        state = create_streaming_state("BTC/USDT", [60000])
+        for i in range(3):
+            state.update_candle(60000, create_test_candle(i * 60000, str(100 + i)))
+        tf_state = state.timeframe_states[60000]
+        init_indicator_states(tf_state, ema_fast=12, ema_slow=26, atr_period=14, rolling_window=20)
+        state.last_tick_timestamp_ms = 123
+
+        restored = pickle.loads(pickle.dumps(state))
+
+        assert restored.symbol == "BTC/USDT"
+        assert restored.last_tick_timestamp_ms == 123
+        restored_tf = restored.timeframe_states[60000]
+        assert restored_tf.last_candle == tf_state.last_candle
+        assert restored_tf.candle_history == tf_state.candle_history
+        assert restored_tf.candle_history.maxlen == tf_state.max_history
+        assert restored_tf.indicators.ema_fast == tf_state.indicators.ema_fast
@@ -2,22 +2,33 @@
 Tests for transform functions.
 """
 
+import math
 from decimal import Decimal
+from typing import cast
+
+import pytest
 
 from src.advanced_prep.transforms import (
     compute_candle_body_size,
     compute_candle_range,
     compute_candle_wick_sizes,
     compute_heiken_ashi,
+    compute_heiken_ashi_batch,
+    compute_log_returns_float,
     compute_log_returns_series,
+    compute_percentage_returns_float,
     compute_percentage_returns_series,
+    compute_pivot_bundle,
+    compute_pivot_bundle_float,
     compute_pivot_point,
     compute_support_resistance,
     compute_typical_price,
     is_bearish_candle,
     is_bullish_candle,
     normalize_min_max,
+    normalize_min_max_float,
     normalize_z_score,
+    normalize_z_score_float,
 )
 from src.types import ResampledCandleData
 
@@ -72,6 +83,57 @@ class TestHeikenAshi:
         # HA Open = (prev_ha_open + prev_ha_close) / 2 = (102.5 + 102.5) / 2 = 102.5
         assert ha2["ha_open"] == Decimal("102.5")
 
+    def test_batch_matches_streaming(self) -> None:
+        """Test batch HA over float columns matches per-candle computation."""
+        candles = [
+            create_test_candle("100", "110", "95", "105"),
+            create_test_candle("105", "115", "100", "112"),
+            create_test_candle("112", "113", "98", "99"),
+        ]
+
+        ha_opens, ha_highs, ha_lows, ha_closes = compute_heiken_ashi_batch(
+            [float(c["open"]) for c in candles],
+            [float(c["high"]) for c in candles],
+            [float(c["low"]) for c in candles],
+            [float(c["close"]) for c in candles],
+        )
+
+        prev_ha = None
+        for i, candle in enumerate(candles):
+            prev_ha = compute_heiken_ashi(candle, prev_ha)
+            assert abs(ha_opens[i] - float(prev_ha["ha_open"])) < 1e-9
+            assert abs(ha_highs[i] - float(prev_ha["ha_high"])) < 1e-9
+            assert abs(ha_lows[i] - float(prev_ha["ha_low"])) < 1e-9
+            assert abs(ha_closes[i] - float(prev_ha["ha_close"])) < 1e-9
+
+    def test_generic_path_accepts_float_candles(self) -> None:
+        """Test the generic HA path keeps float prices float and matches Decimal."""
+        candles = [
+            create_test_candle("100", "110", "95", "105"),
+            create_test_candle("105", "115", "100", "112"),
+        ]
+
+        prev_ha = None
+        prev_ha_float = None
+        for candle in candles:
+            float_candle = dict(candle)
+            for key in ("open", "high", "low", "close"):
+                float_candle[key] = float(candle[key])
+
+            prev_ha = compute_heiken_ashi(candle, prev_ha)
+            prev_ha_float = compute_heiken_ashi(
+                cast(ResampledCandleData, float_candle), prev_ha_float
+            )
+
+            assert type(prev_ha_float["ha_close"]) is float
+            for key in ("ha_open", "ha_high", "ha_low", "ha_close"):
+                assert prev_ha_float[key] == float(prev_ha[key])
+
+    def test_batch_length_mismatch(self) -> None:
+        """Test batch HA rejects mismatched series."""
+        with pytest.raises(ValueError):
+            compute_heiken_ashi_batch([1.0], [1.0, 2.0], [1.0], [1.0])
+
 
 class TestReturns:
     """Tests for return computations."""
@@ -84,6 +146,7 @@ class TestReturns:
         assert len(returns) == 2
         # ln(110/100) = ln(1.1) ≈ 0.0953
         assert abs(returns[0] - Decimal("0.0953")) < Decimal("0.001")
+        assert returns[0] == Decimal(repr(math.log(1.1)))
 
     def test_compute_log_returns_edge_cases(self) -> None:
         """Test log returns edge cases."""
@@ -105,6 +168,23 @@ class TestReturns:
         # (105-110)/110 * 100 = -4.545...
         assert abs(returns[1] - Decimal("-4.545")) < Decimal("0.01")
 
+    def test_float_returns_match_decimal(self) -> None:
+        """Test float fast-path returns match Decimal series."""
+        prices = [Decimal(str(x)) for x in [100, 110, 105, 0, 120]]
+        floats = [float(p) for p in prices]
+
+        log_returns = compute_log_returns_float(floats)
+        pct_returns = compute_percentage_returns_float(floats)
+
+        assert len(log_returns) == 4
+        for fast, slow in zip(log_returns, compute_log_returns_series(prices), strict=True):
+            assert abs(fast - float(slow)) < 1e-12
+        for fast, slow in zip(pct_returns, compute_percentage_returns_series(prices), strict=True):
+            assert abs(fast - float(slow)) < 1e-9
+
+        assert compute_log_returns_float([100.0]) == []
+        assert compute_percentage_returns_float([]) == []
+
 
 class TestNormalization:
     """Tests for normalization functions."""
@@ -136,6 +216,13 @@ class TestNormalization:
         result = normalize_z_score(Decimal("30"), Decimal("20"), Decimal("0"))
         assert result == Decimal("0")
 
+    def test_normalize_float_series(self) -> None:
+        """Float series normalizers match the scalar Decimal versions."""
+        assert normalize_min_max_float([0.0, 50.0, 100.0], 0.0, 100.0) == [0.0, 0.5, 1.0]
+        assert normalize_min_max_float([50.0, 50.0], 50.0, 50.0) == [0.0, 0.0]
+        assert normalize_z_score_float([30.0, 10.0], 20.0, 5.0) == [2.0, -2.0]
+        assert normalize_z_score_float([30.0], 20.0, 0.0) == [0.0]
+
 
 class TestPriceHelpers:
     """Tests for price helper functions."""
@@ -167,6 +254,19 @@ class TestPriceHelpers:
         # S2 = 100 - (110 - 90) = 80
         assert s2 == Decimal("80")
 
+    def test_compute_pivot_bundle(self) -> None:
+        """Test fused pivot bundle matches the separate helpers."""
+        high, low, close = Decimal("112"), Decimal("91"), Decimal("104")
+        pivot = compute_pivot_point(high, low, close)
+
+        bundle = compute_pivot_bundle(high, low, close)
+        assert bundle == (pivot, *compute_support_resistance(pivot, high, low))
+
+        columns = compute_pivot_bundle_float([112.0, 110.0], [91.0, 90.0], [104.0, 100.0])
+        assert [column[1] for column in columns] == [100.0, 110.0, 120.0, 90.0, 80.0]
+        for column, expected in zip(columns, bundle, strict=True):
+            assert abs(column[0] - float(expected)) < 1e-9
+
 
 class TestCandleAnalysis:
     """Tests for candle analysis functions."""
@@ -0,0 +1,68 @@
+"""
+Tests for shared utility functions.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from src.advanced_prep.utils import (
+    batch_to_chunks,
+    clamp,
+    safe_divide,
+    validate_non_negative,
+    validate_positive,
+)
+
+
+class TestBatchToChunks:
+    """Tests for batch_to_chunks."""
+
+    def test_chunks(self) -> None:
+        """Test items are split into ordered chunks with a short tail."""
+        assert list(batch_to_chunks([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+        assert list(batch_to_chunks([], 3)) == []
+
+    def test_invalid_chunk_size_raises_eagerly(self) -> None:
+        """Test invalid chunk size is rejected before iteration starts."""
+        with pytest.raises(ValueError):
+            batch_to_chunks([1, 2], 0)
+
+
+class TestNumericHelpers:
+    """Tests for numeric helper functions."""
+
+    def test_safe_divide(self) -> None:
+        """Test division with zero-denominator default."""
+        assert safe_divide(Decimal("1"), Decimal("4")) == Decimal("0.25")
+        assert safe_divide(Decimal("1"), Decimal("0")) == Decimal("0")
+        assert safe_divide(Decimal("1"), Decimal("0"), Decimal("-1")) == Decimal("-1")
+
+    def test_clamp(self) -> None:
+        """Test clamping below, inside and above the range."""
+        low, high = Decimal("0"), Decimal("10")
+        assert clamp(Decimal("-1"), low, high) == low
+        assert clamp(Decimal("5"), low, high) == Decimal("5")
+        assert clamp(Decimal("11"), low, high) == high
+
+    def test_clamp_inverted_bounds(self) -> None:
+        """Test inverted bounds resolve to min_val, as with max(min_val, min(value, max_val))."""
+        assert clamp(Decimal("6"), Decimal("5"), Decimal("3")) == Decimal("5")
+        assert clamp(Decimal("1"), Decimal("5"), Decimal("3")) == Decimal("5")
+
+    def test_validate_positive(self) -> None:
+        """Test positive validation across numeric types."""
+        validate_positive(Decimal("0.1"), "qty")
+        validate_positive(1, "qty")
+        validate_positive(0.5, "qty")
+        for bad in (Decimal("0"), Decimal("-1"), 0, -0.5, "1", None):
+            with pytest.raises(ValueError):
+                validate_positive(bad, "qty")
+
+    def test_validate_non_negative(self) -> None:
+        """Test non-negative validation across numeric types."""
+        validate_non_negative(Decimal("0"), "qty")
+        validate_non_negative(0, "qty")
+        for bad in (Decimal("-0.1"), -1, "0"):
+            with pytest.raises(ValueError):
+                validate_non_negative(bad, "qty")
@@ -1,14 +1,22 @@
 """Unit tests for controller orchestrator."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.data_controller.controller import (
+    _dispatch_event,
+    _emit_error,
+    _emit_status_change,
     create_controller,
+    fetch_historical,
     get_all_provider_health,
     get_provider_health,
     get_provider_status,
+    set_handlers,
+    stop_controller,
 )
 from src.types import HandlersData, ProviderConfigData
 
@@ -130,6 +138,20 @@ class TestCreateController:
         assert "unknown_provider" not in controller["providers"]
 
 
+class TestProviderOps:
+    """Tests for per-provider operation resolution."""
+
+    def test_binance_variants_share_ops(self, binance_config):
+        """Binance-prefixed providers resolve to the Binance operations."""
+        futures_config = {**binance_config, "name": "binance_futures"}
+        controller = create_controller([binance_config, futures_config])
+
+        ops = controller["provider_ops"]
+        assert set(ops) == {"binance", "binance_futures"}
+        assert ops["binance"] is ops["binance_futures"]
+        assert "iter_messages" in ops["binance"]
+
+
 class TestGetProviderStatus:
     """Tests for get_provider_status function."""
 
@@ -208,3 +230,230 @@ class TestGetAllProviderHealth:
         provider_names = [h["provider"] for h in health_list]
         assert "binance" in provider_names
         assert "binance_testnet" in provider_names
+
+
+class TestDispatchEvent:
+    """Tests for _dispatch_event routing."""
+
+    def test_routes_to_matching_handler_and_bus(self, binance_config, handlers):
+        """Event reaches its direct handler, the internal bus and the external emitter."""
+        external_emit = MagicMock()
+        controller = create_controller(
+            [binance_config], handlers, event_bus_config={"emit": external_emit}
+        )
+        received = []
+        controller["event_bus"]["subscribers"]["candle"] = [received.append]
+
+        _dispatch_event(controller, "candle", {"symbol": "BTC/USDT"})
+
+        handlers["on_candle"].assert_called_once_with({"symbol": "BTC/USDT"})
+        handlers["on_trade"].assert_not_called()
+        assert received == [{"type": "candle", "data": {"symbol": "BTC/USDT"}}]
+        external_emit.assert_called_once_with("candle", received[0])
+
+    def test_external_envelope_is_separate(self, binance_config):
+        """Mutating the internal bus envelope does not affect the external one."""
+        external_emit = MagicMock()
+        controller = create_controller([binance_config], event_bus_config={"emit": external_emit})
+        controller["event_bus"]["subscribers"]["trade"] = [lambda e: e.update(tag="seen")]
+
+        _dispatch_event(controller, "trade", {"price": 1})
+
+        external_emit.assert_called_once_with("trade", {"type": "trade", "data": {"price": 1}})
+
+    def test_handler_error_does_not_stop_emit(self, binance_config, handlers):
+        """Handler exceptions are logged and the event is still emitted."""
+        handlers["on_trade"].side_effect = RuntimeError("boom")
+        controller = create_controller([binance_config], handlers)
+
+        _dispatch_event(controller, "trade", {"price": 1})
+
+        assert controller["event_bus"]["event_count"] == 1
+
+    def test_unknown_event_type_only_emits(self, binance_config, handlers):
+        """Event types without a direct handler are still emitted to the bus."""
+        controller = create_controller([binance_config], handlers)
+
+        _dispatch_event(controller, "custom", {"x": 1})
+
+        handlers["on_trade"].assert_not_called()
+        assert controller["event_bus"]["event_count"] == 1
+
+    def test_set_handlers_rebuilds_dispatch_table(self, binance_config, handlers):
+        """Replacing handlers routes later events to the new callbacks."""
+        controller = create_controller([binance_config], handlers)
+        new_on_trade = MagicMock()
+
+        set_handlers(controller, {"on_trade": new_on_trade})
+        _dispatch_event(controller, "trade", {"price": 1})
+
+        new_on_trade.assert_called_once_with({"price": 1})
+        handlers["on_trade"].assert_not_called()
+        assert "candle" not in controller["dispatch_table"]
+
+    def test_error_data_event_skips_control_handlers(self, binance_config, handlers):
+        """Provider events typed like control events do not reach on_error/on_status_change."""
+        controller = create_controller([binance_config], handlers)
+
+        _dispatch_event(controller, "error", {"code": 1})
+        _dispatch_event(controller, "status_change", {"code": 2})
+
+        handlers["on_error"].assert_not_called()
+        handlers["on_status_change"].assert_not_called()
+        assert controller["event_bus"]["event_count"] == 2
+
+    def test_set_handlers_routes_status_and_error(self, binance_config, handlers):
+        """Status change and error events use the rebuilt handlers too."""
+        controller = create_controller([binance_config], handlers)
+        new_on_error = MagicMock()
+
+        set_handlers(controller, {"on_error": new_on_error})
+        error = RuntimeError("boom")
+        _emit_error(controller, "binance", error)
+        _emit_status_change(controller, "binance", "disconnected", "connected")
+
+        new_on_error.assert_called_once_with("binance", error)
+        handlers["on_error"].assert_not_called()
+        handlers["on_status_change"].assert_not_called()
+
+    def test_handler_executor_runs_handlers_off_loop(self, binance_config, handlers):
+        """Direct handlers are submitted to the executor when one is given."""
+        handlers["on_candle"].side_effect = RuntimeError("boom")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            controller = create_controller([binance_config], handlers, handler_executor=executor)
+
+            _dispatch_event(controller, "trade", {"price": 1})
+            _dispatch_event(controller, "candle", {"close": 2})
+
+        handlers["on_trade"].assert_called_once_with({"price": 1})
+        handlers["on_candle"].assert_called_once_with({"close": 2})
+        assert controller["event_bus"]["event_count"] == 2
+
+
+class TestStopController:
+    """Tests for stop_controller function."""
+
+    def test_shutdown_timeout_defaults_without_config_key(self, binance_config):
+        """Configs without reliability.shutdown_timeout_s fall back to the default."""
+        with patch("src.data_controller.controller.get_config", side_effect=lambda k, d=None: d):
+            controller = create_controller([binance_config])
+
+        assert controller["shutdown_timeout_s"] == 5.0
+
+    @pytest.mark.asyncio
+    async def test_stuck_task_does_not_block_shutdown(self, binance_config):
+        """Tasks that ignore cancellation are abandoned after the timeout."""
+        controller = create_controller([binance_config])
+        release = asyncio.Event()
+
+        async def stubborn() -> None:
+            while not release.is_set():
+                try:
+                    await release.wait()
+                except asyncio.CancelledError:
+                    continue
+
+        task = asyncio.create_task(stubborn())
+        await asyncio.sleep(0)
+        controller["tasks"].append(task)
+        disconnect = AsyncMock()
+        controller["provider_ops"]["binance"] = {
+            **controller["provider_ops"]["binance"],
+            "disconnect": disconnect,
+        }
+
+        controller["shutdown_timeout_s"] = 0.01
+
+        await asyncio.wait_for(stop_controller(controller), timeout=1)
+
+        assert controller["tasks"] == []
+        disconnect.assert_awaited_once()
+        release.set()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_storage_flushed_after_stuck_tasks_finish(self, binance_config):
+        """Records buffered by a task unblocked on disconnect reach the final flush."""
+        write = AsyncMock()
+        controller = create_controller(
+            [binance_config],
+            storage_config={"enabled": True, "batch_size": 1000, "write": write},
+        )
+        closed = asyncio.Event()
+
+        async def stuck_until_closed() -> None:
+            while not closed.is_set():
+                try:
+                    await closed.wait()
+                except asyncio.CancelledError:
+                    continue
+            controller["storage_buffer"]["buffer"].append({"trade_id": 1})
+
+        task = asyncio.create_task(stuck_until_closed())
+        await asyncio.sleep(0)
+        controller["tasks"].append(task)
+
+        async def disconnect(_state) -> None:
+            closed.set()
+
+        controller["provider_ops"]["binance"] = {
+            **controller["provider_ops"]["binance"],
+            "disconnect": disconnect,
+        }
+        controller["shutdown_timeout_s"] = 0.01
+
+        await asyncio.wait_for(stop_controller(controller), timeout=1)
+
+        assert task.done()
+        write.assert_awaited_once_with({"trade_id": 1})
+
+
+class TestFetchHistorical:
+    """Tests for fetch_historical function."""
+
+    @pytest.mark.asyncio
+    async def test_early_exit_keeps_yielded_records_buffered(self, binance_config):
+        """Only yielded records are buffered, even if the consumer breaks without aclose."""
+        controller = create_controller(
+            [binance_config],
+            storage_config={"enabled": True, "batch_size": 1000, "write": AsyncMock()},
+        )
+
+        async def candles(_state, _request):
+            for i in range(120):
+                yield {"open_time_ms": i}
+
+        controller["provider_ops"]["binance"] = {
+            **controller["provider_ops"]["binance"],
+            "fetch_historical_candles": candles,
+        }
+
+        yielded = []
+        async for record in fetch_historical(controller, "binance", {"data_type": "candle"}):
+            yielded.append(record)
+            if len(yielded) == 55:
+                break
+
+        assert controller["storage_buffer"]["buffer"] == yielded
+
+    @pytest.mark.asyncio
+    async def test_all_records_yielded_and_buffered(self, binance_config):
+        """Every record is yielded in order and buffered."""
+        controller = create_controller(
+            [binance_config],
+            storage_config={"enabled": True, "batch_size": 1000, "write": AsyncMock()},
+        )
+
+        async def trades(_state, _request):
+            for i in range(73):
+                yield {"trade_id": i}
+
+        controller["provider_ops"]["binance"] = {
+            **controller["provider_ops"]["binance"],
+            "fetch_historical_trades": trades,
+        }
+
+        yielded = [r async for r in fetch_historical(controller, "binance", {"data_type": "trade"})]
+
+        assert yielded == [{"trade_id": i} for i in range(73)]
+        assert controller["storage_buffer"]["buffer"] == yielded
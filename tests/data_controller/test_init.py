@@ -0,0 +1,57 @@
+"""Unit tests for data controller package exports."""
+
+import ast
+import inspect
+import subprocess
+import sys
+
+import pytest
+
+import src.data_controller as data_controller
+from src.data_controller import event_bus
+
+
+class TestLazyExports:
+    """Tests for lazily resolved package exports."""
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ resolves to its submodule object."""
+        for name in data_controller.__all__:
+            assert getattr(data_controller, name) is not None
+
+        assert data_controller.create_event_bus is event_bus.create_event_bus
+
+    def test_all_exports_resolve_through_getattr(self):
+        """Every name in __all__ is served by the module __getattr__ from its submodule."""
+        assert sorted(data_controller._LAZY_EXPORTS) == data_controller.__all__
+
+        for name in data_controller.__all__:
+            module = sys.modules[data_controller._LAZY_EXPORTS[name]]
+            assert data_controller.__getattr__(name) is getattr(module, name)
+
+    def test_type_checking_imports_match_exports(self):
+        """The TYPE_CHECKING imports list exactly the lazily exported names."""
+        tree = ast.parse(inspect.getsource(data_controller))
+        imported = {
+            alias.name
+            for node in ast.walk(tree)
+            if isinstance(node, ast.ImportFrom)
+            and node.module in data_controller._SUBMODULE_EXPORTS
+            for alias in node.names
+        }
+        assert imported == set(data_controller.__all__)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = data_controller.not_an_export
+
+    def test_event_bus_import_does_not_load_controller(self):
+        """Importing one submodule does not import the controller."""
+        code = (
+            "import sys\n"
+            "from src.data_controller import create_event_bus\n"
+            "assert 'src.data_controller.controller' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, check=False)
+        assert result.returncode == 0, result.stderr.decode()
@@ -1,6 +1,7 @@
 """Unit tests for normalization functions."""
 
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 
@@ -37,6 +38,16 @@ class TestToDecimal:
         """Convert negative value."""
         assert to_decimal("-50.5") == Decimal("-50.5")
 
+    def test_decimal_passthrough(self):
+        """Decimal input is returned unchanged."""
+        value = Decimal("1.50")
+        assert to_decimal(value) is value
+
+    def test_bool_raises(self):
+        """Booleans are not treated as numbers."""
+        with pytest.raises(ValueError):
+            to_decimal(True)
+
     def test_scientific_notation(self):
         """Convert scientific notation string."""
         assert to_decimal("1e-8") == Decimal("1e-8")
@@ -66,6 +77,7 @@ class TestNormalizeSide:
             ("buyer", "buy"),
             ("sell", "sell"),
             ("SELL", "sell"),
+            ("Sell", "sell"),
             ("ask", "sell"),
             ("s", "sell"),
             ("short", "sell"),
@@ -111,6 +123,18 @@ class TestNormalizeSymbol:
         result = normalize_symbol("ABCXYZ", "binance")
         assert result == "ABCXYZ"
 
+    def test_quote_config_change_is_respected(self):
+        """Cached splits are keyed by the configured quotes."""
+        assert normalize_symbol("ABCXYZ", "binance") == "ABCXYZ"
+
+        with patch(
+            "src.data_controller.normalization.get_config",
+            return_value=["XYZ"],
+        ):
+            assert normalize_symbol("ABCXYZ", "binance") == "ABC/XYZ"
+
+        assert normalize_symbol("ABCXYZ", "binance") == "ABCXYZ"
+
 
 class TestDenormalizeSymbol:
     """Tests for denormalize_symbol function."""
@@ -241,6 +265,18 @@ class TestValidateOrderbookIntegrity:
         assert is_valid is False
         assert "Bids not sorted" in error
 
+    def test_unsorted_asks_reports_index(self):
+        """Detect unsorted asks and report the offending index."""
+        bids = [(Decimal("100"), Decimal("1"))]
+        asks = [
+            (Decimal("101"), Decimal("1")),
+            (Decimal("102"), Decimal("1")),
+            (Decimal("102"), Decimal("1")),
+        ]
+        is_valid, error = validate_orderbook_integrity(bids, asks)
+        assert is_valid is False
+        assert error == "Asks not sorted ascending at index 2"
+
     def test_empty_book_valid(self):
         """Accept empty order book."""
         is_valid, error = validate_orderbook_integrity([], [])
@@ -0,0 +1,33 @@
+"""Unit tests for storage buffer."""
+
+from src.data_controller.storage import buffer_record, buffer_records, create_storage_buffer
+
+
+class TestBufferRecords:
+    """Tests for buffer_record and buffer_records functions."""
+
+    def test_bulk_matches_single_appends(self):
+        """buffer_records buffers the same records as repeated buffer_record."""
+        records = [{"price": i} for i in range(3)]
+        single = create_storage_buffer({"enabled": True, "batch_size": 100})
+        bulk = create_storage_buffer({"enabled": True, "batch_size": 100})
+
+        for record in records:
+            buffer_record(single, record)
+        buffer_records(bulk, iter(records))
+
+        assert bulk["buffer"] == single["buffer"] == records
+
+    def test_disabled_buffer_ignores_records(self):
+        """Disabled storage does not buffer anything."""
+        state = create_storage_buffer({"enabled": False})
+
+        buffer_records(state, [{"price": 1}])
+
+        assert state["buffer"] == []
+
+    def test_batch_size_defaults_from_config(self):
+        """Missing batch_size falls back to storage defaults."""
+        state = create_storage_buffer({"enabled": True})
+
+        assert state["batch_size"] > 0
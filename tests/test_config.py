@@ -13,6 +13,7 @@ from src.config import (
     get_secret,
     get_storage_defaults,
     get_validation_config,
+    load_config,
     reload_config,
 )
 
@@ -36,6 +37,14 @@ class TestGetConfig:
         assert isinstance(quote_currencies, list)
         assert "USDT" in quote_currencies
 
+    def test_section_mutation_does_not_leave_keys_stale(self):
+        """Sections are returned as copies, so dot-key lookups stay consistent."""
+        section = get_config("binance")
+        section["ws_url"] = "wss://changed"
+
+        assert get_config("binance.ws_url") == "wss://stream.binance.com:9443/ws"
+        assert get_config("binance")["ws_url"] == "wss://stream.binance.com:9443/ws"
+
     def test_get_missing_key_returns_default(self):
         """Missing key returns default value."""
         result = get_config("nonexistent.key", "default_value")
@@ -72,6 +81,17 @@ class TestGetSecret:
         result = get_secret("nonexistent.secret.key")
         assert result is None
 
+    def test_secret_path_through_non_dict_returns_none(self):
+        """Walking past a non-dict secrets value returns None."""
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch("src.config._secrets", {"binance": {"api_key": "abc", "ids": [1, 2]}}),
+        ):
+            assert get_secret("binance.api_key") == "abc"
+            assert get_secret("binance.api_key.extra") is None
+            assert get_secret("binance.ids.first") is None
+            assert get_secret("binance") is None
+
 
 class TestConvenienceAccessors:
     """Tests for convenience accessor functions."""
@@ -104,6 +124,7 @@ class TestConvenienceAccessors:
         assert config["max_delay_ms"] == 60000
         assert config["failure_threshold"] == 5
         assert config["recovery_timeout_s"] == 60.0
+        assert config["shutdown_timeout_s"] == 5.0
 
     def test_get_storage_defaults(self):
         """Get storage default settings."""
@@ -133,3 +154,18 @@ class TestReloadConfig:
         config = reload_config()
         assert "schema_version" in config
         assert "binance" in config
+
+    def test_reload_invalidates_cached_lookups(self, tmp_path):
+        """Cached lookups are refreshed when a different config is loaded."""
+        assert get_config("schema_version") == "1.0.0"
+
+        custom = tmp_path / "custom.yaml"
+        custom.write_text('schema_version: "2.0.0"\n')
+        try:
+            load_config(custom)
+            assert get_config("schema_version") == "2.0.0"
+            assert get_config("binance.ws_url", "missing") == "missing"
+        finally:
+            reload_config()
+
+        assert get_config("schema_version") == "1.0.0"